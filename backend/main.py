@@ -1,4 +1,5 @@
 """Main FastAPI application for CareerAgentPro backend."""
+import asyncio
 import sys
 import os
 import logging
@@ -17,7 +18,7 @@ import uvicorn
 from dotenv import load_dotenv
 from schemas import EnhancementRequest, CoverLetterRequest, CommunicationRequest, ResumeData, BulletSelectionRequest, SixPointBullet
 from services.ai_service import AIService
-from services.job_service import JobService
+from services.job_service import JobService, close_http_client
 from services.export_service import ExportService
 from services.autofill_service import AutofillService
 from services.resume_parser import ResumeParser
@@ -83,6 +84,11 @@ ai_service = get_ai_service()
 job_service = JobService(ai_service)
 export_service = get_export_service()
 
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    """Release pooled connections held by the job page fetcher."""
+    await close_http_client()
+
 # Exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc):
@@ -301,7 +307,7 @@ async def export_docx(resume: ResumeData):
         with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp_file:
             output_path = tmp_file.name
         
-        export_service.to_docx(resume, output_path)
+        await asyncio.to_thread(export_service.to_docx, resume, output_path)
         
         response = FileResponse(
             output_path,
@@ -326,7 +332,7 @@ async def export_pdf(resume: ResumeData):
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
             output_path = tmp_file.name
         
-        export_service.to_pdf(resume, output_path)
+        await asyncio.to_thread(export_service.to_pdf, resume, output_path)
         
         response = FileResponse(
             output_path,
@@ -2,10 +2,22 @@
 Performance optimization utilities for the backend.
 """
 from functools import lru_cache
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Iterable, Set, Tuple
+import json
+import re
 import time
 import logging
 
+try:
+    import ahocorasick  # Optional: pyahocorasick for single-pass keyword scans
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: C JSON parsing/serialization
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,12 +32,115 @@ def timing_decorator(func: Callable) -> Callable:
     return wrapper
 
 
+def json_loads(text: str) -> Any:
+    """
+    Parse JSON with orjson when installed, else the stdlib.
+    
+    Both raise ``json.JSONDecodeError`` (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def canonical_json(value: Any) -> bytes:
+    """
+    Key-sorted JSON encoding of ``value`` for content hashing; values JSON
+    cannot represent are encoded via ``str``. Raises ``TypeError`` or
+    ``ValueError`` when ``value`` still cannot be encoded.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            value, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(value, sort_keys=True, default=str).encode()
+
+
 @lru_cache(maxsize=128)
 def cached_prompt_builder(template: str, *args) -> str:
     """Cache frequently used prompt templates."""
     return template.format(*args)
 
 
+@lru_cache(maxsize=4096)
+def _word_pattern(keyword: str) -> "re.Pattern[str]":
+    """Compiled whole-word pattern for a keyword."""
+    return re.compile(r"\b" + re.escape(keyword) + r"\b")
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Same test as regex ``\\b``: word-ness differs on either side of ``index``."""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_")
+    after = index < len(text) and (text[index].isalnum() or text[index] == "_")
+    return before != after
+
+
+class KeywordMatcher:
+    """
+    Count a fixed set of keywords in lowercase text.
+
+    Build once and reuse. With pyahocorasick installed all keywords are found
+    in a single pass over the text; otherwise each keyword falls back to
+    ``str.count``. Both paths count non-overlapping occurrences, so results
+    match ``str.count`` exactly.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def counts(self, text: str) -> Dict[str, int]:
+        """Return occurrence counts for the keywords present in ``text``."""
+        found: Dict[str, int] = {}
+        if self._automaton is None:
+            for keyword in self.keywords:
+                count = text.count(keyword)
+                if count:
+                    found[keyword] = count
+            return found
+        
+        # Matches arrive ordered by end position; skip overlapping repeats
+        next_start: Dict[str, int] = {}
+        for end, keyword in self._automaton.iter(text):
+            start = end - len(keyword) + 1
+            if start >= next_start.get(keyword, 0):
+                found[keyword] = found.get(keyword, 0) + 1
+                next_start[keyword] = end + 1
+        return found
+    
+    def found(self, text: str) -> Set[str]:
+        """Return the keywords that occur at least once in ``text``."""
+        if self._automaton is None:
+            return {keyword for keyword in self.keywords if keyword in text}
+        return {keyword for _, keyword in self._automaton.iter(text)}
+    
+    def found_words(self, text: str) -> Set[str]:
+        """Return the keywords that occur in ``text`` as whole words (``\\b`` boundaries)."""
+        if self._automaton is None:
+            return {keyword for keyword in self.keywords if _word_pattern(keyword).search(text)}
+        
+        found: Set[str] = set()
+        for end, keyword in self._automaton.iter(text):
+            if keyword in found:
+                continue
+            start = end - len(keyword) + 1
+            if _is_boundary(text, start) and _is_boundary(text, end + 1):
+                found.add(keyword)
+        return found
+
+
+@lru_cache(maxsize=128)
+def get_keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Return a shared KeywordMatcher for a keyword tuple, building it on first use."""
+    return KeywordMatcher(keywords)
+
+
 class PerformanceMonitor:
     """Monitor API endpoint performance."""
     
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.responses import FileResponse, PlainTextResponse
+import asyncio
 import logging
 import tempfile
 from schemas import ResumeData
@@ -19,7 +20,7 @@ async def export_docx(
         with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp_file:
             output_path = tmp_file.name
         
-        export_service.to_docx(resume, output_path)
+        await asyncio.to_thread(export_service.to_docx, resume, output_path)
         
         response = FileResponse(
             output_path,
@@ -45,7 +46,7 @@ async def export_pdf(
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
             output_path = tmp_file.name
         
-        export_service.to_pdf(resume, output_path)
+        await asyncio.to_thread(export_service.to_pdf, resume, output_path)
         
         response = FileResponse(
             output_path,
@@ -13,6 +13,16 @@ from env_loader import get_api_key, is_ai_enabled, get_ai_status
 logger = logging.getLogger(__name__)
 
 
+def _unfence_json(text: str) -> str:
+    """Body of the first ```json fence, else of the first ``` fence; unfenced text is returned as is."""
+    _, fence, rest = text.partition("```json")
+    if not fence:
+        _, fence, rest = text.partition("```")
+        if not fence:
+            return text
+    return rest.partition("```")[0].strip()
+
+
 class AIService:
     """AI Service using OpenRouter API for resume parsing and enhancement.
     
@@ -371,10 +381,7 @@ Return ONLY valid JSON, no explanation."""
 
         response = await self.get_completion(prompt, "You are an expert resume writer. Return valid JSON only.")
         
-        if "```json" in response:
-            response = response.split("```json")[1].split("```")[0].strip()
-        elif "```" in response:
-            response = response.split("```")[1].split("```")[0].strip()
+        response = _unfence_json(response)
         
         try:
             return json.loads(response)
@@ -774,10 +781,7 @@ RESUME TEXT:
                 
                 # Robust extraction from markdown if AI ignores instructions
                 clean_response = response.strip()
-                if "```json" in clean_response:
-                    clean_response = clean_response.split("```json")[1].split("```")[0].strip()
-                elif "```" in clean_response:
-                    clean_response = clean_response.split("```")[1].split("```")[0].strip()
+                clean_response = _unfence_json(clean_response)
                 
                 # FINAL FALLBACK: Find first { and last }
                 try:
@@ -840,10 +844,7 @@ RESUME TEXT:
             try:
                 # Try to extract JSON if AI added markdown
                 clean_json = content_accumulated.strip()
-                if "```json" in clean_json:
-                    clean_json = clean_json.split("```json")[1].split("```")[0].strip()
-                elif "```" in clean_json:
-                    clean_json = clean_json.split("```")[1].split("```")[0].strip()
+                clean_json = _unfence_json(clean_json)
                 
                 final_ai_data = json.loads(clean_json)
                 yield "data: " + json.dumps({"status": "completed", "data": final_ai_data}) + "\n\n"
@@ -8,14 +8,94 @@ Character limit: 240-260 characters per bullet for optimal ATS compatibility.
 """
 
 import re
+import random
 import logging
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+from performance_utils import KeywordMatcher, get_keyword_matcher
+
 logger = logging.getLogger(__name__)
 
 
+def _first_char_class(pattern: str) -> Optional[str]:
+    """
+    Return the character-class body for the first character ``pattern`` can
+    match, or None when it cannot be determined from simple leading atoms.
+    """
+    # A top-level alternation can start with any of its branches
+    depth = 0
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return None
+    
+    if pattern.startswith("\\d"):
+        atom, rest = "\\d", pattern[2:]
+    elif pattern.startswith("\\") and len(pattern) > 1 and not pattern[1].isalnum():
+        atom, rest = re.escape(pattern[1]), pattern[2:]
+    elif pattern.startswith("[") and not pattern.startswith(("[^", "[]")):
+        end = pattern.find("]")
+        if end == -1:
+            return None
+        atom, rest = pattern[1:end], pattern[end + 1:]
+        # Avoid forming accidental ranges once bodies are concatenated
+        if atom.startswith("-") or atom.endswith(("-", "\\")):
+            return None
+    elif pattern and (pattern[0].isalnum() or pattern[0] == " "):
+        atom, rest = re.escape(pattern[0]), pattern[1:]
+    else:
+        return None
+    
+    # An optional first atom means the match may start with something else
+    if rest.startswith(("?", "*", "{")):
+        return None
+    return atom
+
+
+def _compile_union(patterns: List[str]) -> "re.Pattern[str]":
+    """
+    Compile alternative patterns into one regex so a single search covers them all.
+    
+    When every pattern has a known first character, the union is guarded by a
+    lookahead on that character set. The regex engine then rejects most
+    positions with one class test instead of trying every alternative.
+    """
+    union = "|".join(f"(?:{pattern})" for pattern in patterns)
+    first_chars = [_first_char_class(pattern) for pattern in patterns]
+    if all(first_chars):
+        union = f"(?=[{''.join(dict.fromkeys(first_chars))}])(?:{union})"
+    return re.compile(union)
+
+
+def _build_char_scores(min_chars: int, max_chars: int) -> Tuple[float, ...]:
+    """
+    Precompute the character-count score for every length up to the point where
+    the penalty reaches zero (20 points minus 0.5 per character out of range).
+    """
+    scores = []
+    for char_count in range(max_chars + 41):
+        if min_chars <= char_count <= max_chars:
+            scores.append(20)  # Perfect range
+        elif char_count < min_chars:
+            scores.append(max(0, 20 - (min_chars - char_count) * 0.5))
+        else:
+            scores.append(max(0, 20 - (char_count - max_chars) * 0.5))
+    return tuple(scores)
+
+
 class CompanyStage(Enum):
     """Company stage for spinning strategy."""
     EARLY_STAGE = "early_stage"  # Startup bullets
@@ -23,34 +103,92 @@ class CompanyStage(Enum):
     ENTERPRISE = "enterprise"  # Fortune 500 bullets
 
 
-@dataclass
+# Bit flags for the framework checks packed into BulletAnalysis.flags
+BIT_ACTION = 1 << 0
+BIT_CONTEXT = 1 << 1
+BIT_METHOD = 1 << 2
+BIT_RESULT = 1 << 3
+BIT_IMPACT = 1 << 4
+BIT_BUSINESS_OUTCOME = 1 << 5
+BIT_METRIC = 1 << 6
+
+# The six framework points that make up the base score
+ALL_PREDICATES = (
+    BIT_ACTION | BIT_CONTEXT | BIT_METHOD | BIT_RESULT | BIT_IMPACT | BIT_BUSINESS_OUTCOME
+)
+
+# Suggestion bits: a missing check (BIT_RESULT is covered by BIT_METRIC) or a bad length
+BIT_LENGTH = 1 << 7
+SUGGESTION_CHECKS = (
+    BIT_ACTION | BIT_CONTEXT | BIT_METHOD | BIT_METRIC | BIT_IMPACT | BIT_BUSINESS_OUTCOME
+)
+
+
+@dataclass(frozen=True, slots=True)
 class BulletAnalysis:
-    """Analysis result for a resume bullet."""
+    """
+    Analysis result for a resume bullet.
+    
+    Framework checks are stored as ``BIT_*`` flags and exposed as ``has_*`` properties.
+    Suggestion text is only built when ``suggestions`` is read; ``suggestion_flags``
+    records which suggestions apply. Instances are immutable because
+    analyze_bullet shares them through its cache.
+    """
     original: str
     character_count: int
-    has_action: bool
-    has_context: bool
-    has_method: bool
-    has_result: bool
-    has_impact: bool
-    has_business_outcome: bool
-    has_metric: bool
+    flags: int
     score: float  # 0-100
-    suggestions: List[str]
+    suggestion_flags: int
     enhanced: Optional[str] = None
+    
+    @property
+    def suggestions(self) -> Tuple[str, ...]:
+        if not self.suggestion_flags:
+            return ()
+        return tuple(
+            BulletFramework._generate_suggestions(self.suggestion_flags, self.character_count)
+        )
+    
+    @property
+    def suggestion_count(self) -> int:
+        return self.suggestion_flags.bit_count()
+    
+    @property
+    def has_action(self) -> bool:
+        return bool(self.flags & BIT_ACTION)
+    
+    @property
+    def has_context(self) -> bool:
+        return bool(self.flags & BIT_CONTEXT)
+    
+    @property
+    def has_method(self) -> bool:
+        return bool(self.flags & BIT_METHOD)
+    
+    @property
+    def has_result(self) -> bool:
+        return bool(self.flags & BIT_RESULT)
+    
+    @property
+    def has_impact(self) -> bool:
+        return bool(self.flags & BIT_IMPACT)
+    
+    @property
+    def has_business_outcome(self) -> bool:
+        return bool(self.flags & BIT_BUSINESS_OUTCOME)
+    
+    @property
+    def has_metric(self) -> bool:
+        return bool(self.flags & BIT_METRIC)
 
 
-@dataclass
+@dataclass(slots=True)
 class CompetencyArea:
     """Competency area with weightage."""
     name: str
     weight: float  # 0.0-1.0
     keywords: List[str]
-    matched_bullets: List[str] = None
-
-    def __post_init__(self):
-        if self.matched_bullets is None:
-            self.matched_bullets = []
+    matched_bullets: List[str] = field(default_factory=list)
 
 
 class BulletFramework:
@@ -71,6 +209,11 @@ class BulletFramework:
     MAX_CHARS = 260
     OPTIMAL_CHARS = 250
     
+    # Score lookup tables: base score by number of framework points met, and
+    # character score by bullet length (longer bullets score 0)
+    _BASE_SCORES = tuple((points / 6) * 70 for points in range(7))
+    _CHAR_SCORES = _build_char_scores(MIN_CHARS, MAX_CHARS)
+    
     # Action verbs by category
     ACTION_VERBS = {
         "leadership": [
@@ -103,6 +246,11 @@ class BulletFramework:
         ]
     }
     
+    # Flattened verb set for constant-time first-word lookups
+    _ALL_ACTION_VERBS = frozenset(
+        verb for verbs in ACTION_VERBS.values() for verb in verbs
+    )
+    
     # Context indicators
     CONTEXT_PATTERNS = [
         r"cross-functional",
@@ -168,6 +316,13 @@ class BulletFramework:
         r"competitive advantage"
     ]
     
+    # Each category compiled once into a single alternation
+    _CONTEXT_RE = _compile_union(CONTEXT_PATTERNS)
+    _METHOD_RE = _compile_union(METHOD_PATTERNS)
+    _METRIC_RE = _compile_union(METRIC_PATTERNS)
+    _IMPACT_RE = _compile_union(IMPACT_PATTERNS)
+    _BUSINESS_OUTCOME_RE = _compile_union(BUSINESS_OUTCOME_PATTERNS)
+    
     # Spinning keywords by company stage
     SPINNING_KEYWORDS = {
         CompanyStage.EARLY_STAGE: [
@@ -184,154 +339,170 @@ class BulletFramework:
         ]
     }
 
+    # Lowercased spinning keywords, computed once instead of per call
+    _SPINNING_LC = {
+        stage: tuple(keyword.lower() for keyword in keywords)
+        for stage, keywords in SPINNING_KEYWORDS.items()
+    }
+
+    # Strong stage signals: (phrases, bonus) added once if any phrase is present
+    _STAGE_HEURISTICS = {
+        CompanyStage.EARLY_STAGE: (("seed", "pre-seed", "angel", "small team"), 3),
+        CompanyStage.GROWTH_STAGE: (("series a", "series b", "series c", "hypergrowth"), 3),
+        CompanyStage.ENTERPRISE: (("fortune", "global", "multinational", "corporate"), 3)
+    }
+
+    # One matcher over every stage keyword and heuristic phrase, so the job
+    # description is scanned once instead of once per keyword
+    _STAGE_MATCHER = KeywordMatcher(
+        [keyword for keywords in SPINNING_KEYWORDS.values() for keyword in keywords]
+        + [term for terms, _ in _STAGE_HEURISTICS.values() for term in terms]
+    )
+
     @classmethod
     def analyze_bullet(cls, bullet: str) -> BulletAnalysis:
         """
         Analyze a resume bullet against the 6-point framework.
         
-        Returns detailed analysis with scores and suggestions.
+        Returns detailed analysis with scores and suggestions. Results are
+        memoized per bullet text, so repeated bullets are analyzed once.
         """
-        bullet = bullet.strip()
+        return cls._analyze_cached(bullet.strip())
+    
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop memoized bullet analyses."""
+        cls._analyze_cached.cache_clear()
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _analyze_cached(bullet: str) -> BulletAnalysis:
+        return BulletFramework._analyze(bullet)
+    
+    @classmethod
+    def _analyze(cls, bullet: str) -> BulletAnalysis:
+        """Run the framework checks and scoring for a stripped bullet."""
         char_count = len(bullet)
         
-        # Check each framework point
-        has_action = cls._check_action(bullet)
-        has_context = cls._check_context(bullet)
-        has_method = cls._check_method(bullet)
-        has_result = cls._check_result(bullet)
-        has_impact = cls._check_impact(bullet)
-        has_business_outcome = cls._check_business_outcome(bullet)
-        has_metric = cls._check_metric(bullet)
+        # Check each framework point; keyword checks share one lowercased copy
+        bullet_lower = bullet.lower()
+        flags = 0
+        if cls._check_action(bullet):
+            flags |= BIT_ACTION
+        if cls._check_context(bullet_lower):
+            flags |= BIT_CONTEXT
+        if cls._check_method(bullet_lower):
+            flags |= BIT_METHOD
+        # Result and metric share METRIC_PATTERNS, so one scan sets both bits
+        if cls._check_metric(bullet):
+            flags |= BIT_RESULT | BIT_METRIC
+        if cls._check_impact(bullet_lower):
+            flags |= BIT_IMPACT
+        if cls._check_business_outcome(bullet_lower):
+            flags |= BIT_BUSINESS_OUTCOME
         
         # Calculate score
-        points = [has_action, has_context, has_method, has_result, has_impact, has_business_outcome]
-        base_score = (sum(points) / 6) * 70  # 70% for framework compliance
+        base_score = cls._BASE_SCORES[(flags & ALL_PREDICATES).bit_count()]  # 70% for framework compliance
         
         # Character count bonus/penalty
-        char_score = 0
-        if cls.MIN_CHARS <= char_count <= cls.MAX_CHARS:
-            char_score = 20  # Perfect range
-        elif char_count < cls.MIN_CHARS:
-            char_score = max(0, 20 - (cls.MIN_CHARS - char_count) * 0.5)
-        else:
-            char_score = max(0, 20 - (char_count - cls.MAX_CHARS) * 0.5)
+        char_score = cls._CHAR_SCORES[char_count] if char_count < len(cls._CHAR_SCORES) else 0
         
         # Metric bonus
-        metric_score = 10 if has_metric else 0
+        metric_score = 10 if flags & BIT_METRIC else 0
         
         total_score = min(100, base_score + char_score + metric_score)
         
-        # Generate suggestions
-        suggestions = cls._generate_suggestions(
-            bullet, has_action, has_context, has_method,
-            has_result, has_impact, has_business_outcome,
-            has_metric, char_count
-        )
+        # Record which suggestions apply; the text is built lazily
+        suggestion_flags = ~flags & SUGGESTION_CHECKS
+        if not cls.MIN_CHARS <= char_count <= cls.MAX_CHARS:
+            suggestion_flags |= BIT_LENGTH
         
         return BulletAnalysis(
             original=bullet,
             character_count=char_count,
-            has_action=has_action,
-            has_context=has_context,
-            has_method=has_method,
-            has_result=has_result,
-            has_impact=has_impact,
-            has_business_outcome=has_business_outcome,
-            has_metric=has_metric,
+            flags=flags,
             score=round(total_score, 1),
-            suggestions=suggestions
+            suggestion_flags=suggestion_flags
         )
     
     @classmethod
     def _check_action(cls, bullet: str) -> bool:
         """Check if bullet starts with a strong action verb."""
-        first_word = bullet.split()[0] if bullet.split() else ""
-        first_word = first_word.strip(",.:;")
-        
-        all_verbs = []
-        for verbs in cls.ACTION_VERBS.values():
-            all_verbs.extend(verbs)
-        
-        return first_word in all_verbs
+        # maxsplit=1 stops after the first word instead of splitting the whole bullet
+        words = bullet.split(None, 1)
+        first_word = words[0].strip(",.:;") if words else ""
+        return first_word in cls._ALL_ACTION_VERBS
     
     @classmethod
-    def _check_context(cls, bullet: str) -> bool:
-        """Check if bullet includes context."""
-        bullet_lower = bullet.lower()
-        return any(re.search(pattern, bullet_lower) for pattern in cls.CONTEXT_PATTERNS)
+    def _check_context(cls, bullet_lower: str) -> bool:
+        """Check if bullet includes context (expects lowercased text)."""
+        return cls._CONTEXT_RE.search(bullet_lower) is not None
     
     @classmethod
-    def _check_method(cls, bullet: str) -> bool:
-        """Check if bullet describes the method used."""
-        bullet_lower = bullet.lower()
-        return any(re.search(pattern, bullet_lower) for pattern in cls.METHOD_PATTERNS)
+    def _check_method(cls, bullet_lower: str) -> bool:
+        """Check if bullet describes the method used (expects lowercased text)."""
+        return cls._METHOD_RE.search(bullet_lower) is not None
     
     @classmethod
     def _check_result(cls, bullet: str) -> bool:
-        """Check if bullet includes quantifiable results."""
-        return any(re.search(pattern, bullet) for pattern in cls.METRIC_PATTERNS)
+        """Check if bullet includes quantifiable results (same patterns as _check_metric)."""
+        return cls._check_metric(bullet)
     
     @classmethod
-    def _check_impact(cls, bullet: str) -> bool:
-        """Check if bullet describes impact scope."""
-        bullet_lower = bullet.lower()
-        return any(re.search(pattern, bullet_lower) for pattern in cls.IMPACT_PATTERNS)
+    def _check_impact(cls, bullet_lower: str) -> bool:
+        """Check if bullet describes impact scope (expects lowercased text)."""
+        return cls._IMPACT_RE.search(bullet_lower) is not None
     
     @classmethod
-    def _check_business_outcome(cls, bullet: str) -> bool:
-        """Check if bullet includes business outcome."""
-        bullet_lower = bullet.lower()
-        return any(re.search(pattern, bullet_lower) for pattern in cls.BUSINESS_OUTCOME_PATTERNS)
+    def _check_business_outcome(cls, bullet_lower: str) -> bool:
+        """Check if bullet includes business outcome (expects lowercased text)."""
+        return cls._BUSINESS_OUTCOME_RE.search(bullet_lower) is not None
     
     @classmethod
     def _check_metric(cls, bullet: str) -> bool:
         """Check if bullet contains quantifiable metrics."""
-        return any(re.search(pattern, bullet) for pattern in cls.METRIC_PATTERNS)
+        return cls._METRIC_RE.search(bullet) is not None
     
     @classmethod
-    def _generate_suggestions(
-        cls, bullet: str, has_action: bool, has_context: bool,
-        has_method: bool, has_result: bool, has_impact: bool,
-        has_business_outcome: bool, has_metric: bool, char_count: int
-    ) -> List[str]:
-        """Generate actionable improvement suggestions."""
+    def _generate_suggestions(cls, suggestion_flags: int, char_count: int) -> List[str]:
+        """Generate actionable improvement suggestions from the suggestion flags."""
         suggestions = []
         
-        if not has_action:
+        if suggestion_flags & BIT_ACTION:
             suggestions.append(
                 "Start with a strong action verb like 'Led', 'Developed', 'Optimized', or 'Implemented'"
             )
         
-        if not has_context:
+        if suggestion_flags & BIT_CONTEXT:
             suggestions.append(
                 "Add context about scope (e.g., 'cross-functional team', 'enterprise-wide', 'for Fortune 500 client')"
             )
         
-        if not has_method:
+        if suggestion_flags & BIT_METHOD:
             suggestions.append(
                 "Specify the method/approach (e.g., 'using Agile methodology', 'leveraging data analytics')"
             )
         
-        if not has_result or not has_metric:
+        if suggestion_flags & BIT_METRIC:
             suggestions.append(
                 "Add quantifiable results (e.g., 'reducing costs by 40%', 'increasing efficiency by 2x')"
             )
         
-        if not has_impact:
+        if suggestion_flags & BIT_IMPACT:
             suggestions.append(
                 "Clarify the impact scope (e.g., 'for 500+ users', 'across 10 departments')"
             )
         
-        if not has_business_outcome:
+        if suggestion_flags & BIT_BUSINESS_OUTCOME:
             suggestions.append(
                 "Connect to business value (e.g., 'improving customer satisfaction', 'driving revenue growth')"
             )
         
-        if char_count < cls.MIN_CHARS:
+        if suggestion_flags & BIT_LENGTH and char_count < cls.MIN_CHARS:
             suggestions.append(
                 f"Expand bullet to {cls.MIN_CHARS}-{cls.MAX_CHARS} characters (currently {char_count})"
             )
-        elif char_count > cls.MAX_CHARS:
+        elif suggestion_flags & BIT_LENGTH:
             suggestions.append(
                 f"Condense bullet to {cls.MIN_CHARS}-{cls.MAX_CHARS} characters (currently {char_count})"
             )
@@ -354,20 +525,17 @@ class BulletFramework:
             CompanyStage.ENTERPRISE: 0
         }
         
-        for stage, keywords in cls.SPINNING_KEYWORDS.items():
+        found = cls._STAGE_MATCHER.found(jd_lower)
+        
+        for stage, keywords in cls._SPINNING_LC.items():
             for keyword in keywords:
-                if keyword.lower() in jd_lower:
+                if keyword in found:
                     scores[stage] += 1
         
         # Additional heuristics
-        if any(term in jd_lower for term in ["seed", "pre-seed", "angel", "small team"]):
-            scores[CompanyStage.EARLY_STAGE] += 3
-        
-        if any(term in jd_lower for term in ["series a", "series b", "series c", "hypergrowth"]):
-            scores[CompanyStage.GROWTH_STAGE] += 3
-        
-        if any(term in jd_lower for term in ["fortune", "global", "multinational", "corporate"]):
-            scores[CompanyStage.ENTERPRISE] += 3
+        for stage, (terms, bonus) in cls._STAGE_HEURISTICS.items():
+            if any(term in found for term in terms):
+                scores[stage] += bonus
         
         # Return stage with highest score
         return max(scores, key=scores.get)
@@ -384,6 +552,12 @@ class BulletFramework:
         jd_lower = job_description.lower()
         total_mentions = 0
         
+        # Count every area's keywords in one scan of the job description
+        matcher = get_keyword_matcher(tuple(
+            keyword for area in competency_areas for keyword in area.get("keywords", [])
+        ))
+        keyword_counts = matcher.counts(jd_lower)
+        
         competencies = []
         for area in competency_areas:
             competency = CompetencyArea(
@@ -395,7 +569,7 @@ class BulletFramework:
             # Count keyword mentions
             mentions = 0
             for keyword in competency.keywords:
-                mentions += jd_lower.count(keyword.lower())
+                mentions += keyword_counts.get(keyword.lower(), 0)
             
             competency.weight = mentions
             total_mentions += mentions
@@ -417,41 +591,60 @@ class BulletFramework:
         return competencies
     
     @classmethod
-    def validate_bullet_batch(cls, bullets: List[str]) -> Dict[str, Any]:
+    def validate_bullet_batch(
+        cls, bullets: List[str], analyses: Optional[List[BulletAnalysis]] = None
+    ) -> Dict[str, Any]:
         """
         Validate a batch of bullets and return aggregate statistics.
+        
+        Pass ``analyses`` to reuse results already computed for ``bullets``.
         """
-        analyses = [cls.analyze_bullet(b) for b in bullets]
+        if analyses is None:
+            analyses = [cls.analyze_bullet(b) for b in bullets]
+
+        # Column-wise reductions run in C via map/attrgetter; the per-bit and
+        # per-length totals then only walk the distinct values
+        score_sum = sum(map(attrgetter("score"), analyses))
+        flag_counts = Counter(map(attrgetter("flags"), analyses))
+        length_counts = Counter(map(attrgetter("character_count"), analyses))
         
-        total_score = sum(a.score for a in analyses) / len(analyses) if analyses else 0
+        def bit_total(bit: int) -> int:
+            return sum(count for flags, count in flag_counts.items() if flags & bit)
         
+        under = sum(count for length, count in length_counts.items() if length < cls.MIN_CHARS)
+        over = sum(count for length, count in length_counts.items() if length > cls.MAX_CHARS)
+        opt = len(analyses) - under - over
+        
+        scale = 100 / len(analyses) if analyses else 0
+        total_score = score_sum / len(analyses) if analyses else 0
+
         framework_compliance = {
-            "action": sum(1 for a in analyses if a.has_action) / len(analyses) * 100,
-            "context": sum(1 for a in analyses if a.has_context) / len(analyses) * 100,
-            "method": sum(1 for a in analyses if a.has_method) / len(analyses) * 100,
-            "result": sum(1 for a in analyses if a.has_result) / len(analyses) * 100,
-            "impact": sum(1 for a in analyses if a.has_impact) / len(analyses) * 100,
-            "business_outcome": sum(1 for a in analyses if a.has_business_outcome) / len(analyses) * 100
+            "action": bit_total(BIT_ACTION) * scale,
+            "context": bit_total(BIT_CONTEXT) * scale,
+            "method": bit_total(BIT_METHOD) * scale,
+            "result": bit_total(BIT_RESULT) * scale,
+            "impact": bit_total(BIT_IMPACT) * scale,
+            "business_outcome": bit_total(BIT_BUSINESS_OUTCOME) * scale
         }
-        
+
         char_distribution = {
-            "under_min": sum(1 for a in analyses if a.character_count < cls.MIN_CHARS),
-            "optimal": sum(1 for a in analyses if cls.MIN_CHARS <= a.character_count <= cls.MAX_CHARS),
-            "over_max": sum(1 for a in analyses if a.character_count > cls.MAX_CHARS)
+            "under_min": under,
+            "optimal": opt,
+            "over_max": over
         }
-        
+
         return {
             "total_bullets": len(bullets),
             "average_score": round(total_score, 1),
             "framework_compliance": framework_compliance,
             "character_distribution": char_distribution,
-            "with_metrics": sum(1 for a in analyses if a.has_metric),
+            "with_metrics": bit_total(BIT_METRIC),
             "individual_analyses": [
                 {
                     "bullet": a.original[:50] + "..." if len(a.original) > 50 else a.original,
                     "score": a.score,
                     "char_count": a.character_count,
-                    "suggestions_count": len(a.suggestions)
+                    "suggestions_count": a.suggestion_count
                 }
                 for a in analyses
             ]
@@ -484,31 +677,54 @@ class MetricDiversifier:
         'quality': r'\d+%\s*(?:up from|down from|increase|decrease|improvement|retention|accuracy|satisfaction|precision|recall|conversion)'
     }
     
+    # All metric types in one regex. Each branch is anchored at the start and
+    # looks ahead through the whole bullet, so the first type in METRIC_TYPES
+    # order that occurs anywhere wins, and lastgroup names it.
+    _METRIC_UNION = re.compile(
+        "|".join(f"^(?=.*?(?P<{metric_type}>{pattern}))" for metric_type, pattern in METRIC_TYPES.items()),
+        re.IGNORECASE | re.DOTALL
+    )
+    
     @classmethod
     def classify_metric(cls, bullet: str) -> Optional[str]:
         """Classify the primary metric type in a bullet."""
-        for metric_type, pattern in cls.METRIC_TYPES.items():
-            if re.search(pattern, bullet, re.IGNORECASE):
-                return metric_type
-        return None
+        match = cls._METRIC_UNION.match(bullet)
+        return match.lastgroup if match else None
+    
+    @classmethod
+    def classify_all(cls, bullets: List[str]) -> List[Optional[str]]:
+        """Classify the primary metric type of every bullet."""
+        return [cls.classify_metric(bullet) for bullet in bullets]
     
     @classmethod
-    def check_diversity(cls, bullets: List[str]) -> Dict[str, Any]:
-        """Check metric diversity across all bullets."""
-        from collections import defaultdict
+    def check_diversity(
+        cls,
+        bullets: List[str],
+        metric_types: Optional[List[Optional[str]]] = None,
+        verbose: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Check metric diversity across all bullets.
         
-        metric_distribution = defaultdict(int)
-        classified_bullets = []
+        Pass ``metric_types`` to reuse classifications already computed for ``bullets``.
+        With ``verbose=False`` the per-bullet ``classified_bullets`` entries are skipped.
+        """
+        if metric_types is None:
+            metric_types = cls.classify_all(bullets)
+        
+        metric_distribution = Counter(metric_type for metric_type in metric_types if metric_type)
         
-        for i, bullet in enumerate(bullets):
-            metric_type = cls.classify_metric(bullet)
-            if metric_type:
-                metric_distribution[metric_type] += 1
-                classified_bullets.append({
+        classified_bullets = []
+        if verbose:
+            classified_bullets = [
+                {
                     'bullet_index': i + 1,
                     'metric_type': metric_type,
                     'snippet': bullet[:60] + '...' if len(bullet) > 60 else bullet
-                })
+                }
+                for i, (bullet, metric_type) in enumerate(zip(bullets, metric_types))
+                if metric_type
+            ]
         
         warnings = []
         recommendations = []
@@ -538,7 +754,7 @@ class MetricDiversifier:
 class ActionVerbChecker:
     """Ensure action verb uniqueness across bullets."""
     
-    STRONG_ACTION_VERBS = [
+    STRONG_ACTION_VERBS = (
         'Led', 'Built', 'Designed', 'Spearheaded', 'Drove', 'Launched',
         'Scaled', 'Optimized', 'Implemented', 'Developed', 'Created',
         'Established', 'Orchestrated', 'Pioneered', 'Architected', 'Engineered',
@@ -546,26 +762,48 @@ class ActionVerbChecker:
         'Facilitated', 'Coordinated', 'Analyzed', 'Synthesized', 'Evaluated',
         'Transformed', 'Modernized', 'Automated', 'Integrated', 'Deployed',
         'Championed', 'Initiated', 'Accelerated', 'Enhanced', 'Refined'
-    ]
+    )
+    
+    # Preferred replacements for commonly repeated verbs
+    _ALTERNATIVES = {
+        'Led': ('Spearheaded', 'Directed', 'Orchestrated'),
+        'Built': ('Developed', 'Created', 'Engineered'),
+        'Designed': ('Architected', 'Crafted', 'Engineered'),
+        'Managed': ('Directed', 'Oversaw', 'Coordinated'),
+        'Developed': ('Built', 'Created', 'Engineered'),
+        'Implemented': ('Deployed', 'Executed', 'Launched'),
+        'Created': ('Built', 'Developed', 'Established'),
+        'Improved': ('Enhanced', 'Optimized', 'Refined'),
+        'Increased': ('Boosted', 'Accelerated', 'Amplified'),
+        'Reduced': ('Decreased', 'Minimized', 'Streamlined')
+    }
     
     @classmethod
     def extract_action_verb(cls, bullet: str) -> Optional[str]:
         """Extract the action verb (first word) from a bullet."""
         cleaned = bullet.strip().lstrip('•').lstrip('-').lstrip('*').strip()
-        words = cleaned.split()
+        words = cleaned.split(None, 1)
         if words:
             return words[0].strip('.,;:')
         return None
     
     @classmethod
-    def check_uniqueness(cls, bullets: List[str]) -> Dict[str, Any]:
-        """Check action verb uniqueness across all bullets."""
+    def check_uniqueness(
+        cls, bullets: List[str], verbs: Optional[List[Optional[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Check action verb uniqueness across all bullets.
+        
+        Pass ``verbs`` to reuse action verbs already extracted from ``bullets``.
+        """
+        if verbs is None:
+            verbs = [cls.extract_action_verb(bullet) for bullet in bullets]
+        
         verb_usage = {}
         duplicates = []
         unique_count = 0
         
-        for i, bullet in enumerate(bullets):
-            verb = cls.extract_action_verb(bullet)
+        for i, verb in enumerate(verbs):
             if verb:
                 if verb in verb_usage:
                     duplicates.append({
@@ -597,31 +835,48 @@ class ActionVerbChecker:
     @classmethod
     def _get_alternative_verb(cls, original_verb: str) -> str:
         """Get an alternative action verb."""
-        alternatives = {
-            'Led': ['Spearheaded', 'Directed', 'Orchestrated'],
-            'Built': ['Developed', 'Created', 'Engineered'],
-            'Designed': ['Architected', 'Crafted', 'Engineered'],
-            'Managed': ['Directed', 'Oversaw', 'Coordinated'],
-            'Developed': ['Built', 'Created', 'Engineered'],
-            'Implemented': ['Deployed', 'Executed', 'Launched'],
-            'Created': ['Built', 'Developed', 'Established'],
-            'Improved': ['Enhanced', 'Optimized', 'Refined'],
-            'Increased': ['Boosted', 'Accelerated', 'Amplified'],
-            'Reduced': ['Decreased', 'Minimized', 'Streamlined']
-        }
-        
-        if original_verb in alternatives:
-            return alternatives[original_verb][0]
-        
-        import random
-        return random.choice([v for v in cls.STRONG_ACTION_VERBS if v != original_verb])
+        if original_verb in cls._ALTERNATIVES:
+            return cls._ALTERNATIVES[original_verb][0]
+        
+        # Retry on the rare collision instead of filtering the whole list each call
+        verb = random.choice(cls.STRONG_ACTION_VERBS)
+        while verb == original_verb:
+            verb = random.choice(cls.STRONG_ACTION_VERBS)
+        return verb
+
+
+@dataclass(slots=True)
+class _PreparedBullet:
+    """Per-bullet results shared by the resume-level checks."""
+    analysis: BulletAnalysis
+    metric_type: Optional[str]
+    action_verb: Optional[str]
+
+
+def _preprocess(bullets: List[str]) -> List[_PreparedBullet]:
+    """Derive every per-bullet field used by analyze_complete_resume in one pass."""
+    return [
+        _PreparedBullet(
+            analysis=BulletFramework.analyze_bullet(bullet),
+            metric_type=MetricDiversifier.classify_metric(bullet),
+            action_verb=ActionVerbChecker.extract_action_verb(bullet)
+        )
+        for bullet in bullets
+    ]
 
 
 def analyze_complete_resume(bullets: List[str]) -> Dict[str, Any]:
     """Complete resume analysis combining all frameworks."""
-    batch_analysis = BulletFramework.validate_bullet_batch(bullets)
-    metric_diversity = MetricDiversifier.check_diversity(bullets)
-    verb_uniqueness = ActionVerbChecker.check_uniqueness(bullets)
+    prepared = _preprocess(bullets)
+    batch_analysis = BulletFramework.validate_bullet_batch(
+        bullets, analyses=[p.analysis for p in prepared]
+    )
+    metric_diversity = MetricDiversifier.check_diversity(
+        bullets, metric_types=[p.metric_type for p in prepared]
+    )
+    verb_uniqueness = ActionVerbChecker.check_uniqueness(
+        bullets, verbs=[p.action_verb for p in prepared]
+    )
     
     framework_score = batch_analysis['average_score']
     diversity_score = metric_diversity['diversity_score']
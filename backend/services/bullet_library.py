@@ -3,13 +3,62 @@ Bullet Library Service - Selects the best bullets for a job description.
 Inspired by Apply-Pilot's bullet library workflow.
 """
 
-import re
-from typing import Dict, Any, List, Tuple
+from typing import AbstractSet, Dict, Any, FrozenSet, List, Optional, Set, Tuple
 
+from performance_utils import KeywordMatcher, get_keyword_matcher
 from services.jd_assessor import JDAssessor
 from services.bullet_framework import BulletFramework
 
 
+def _build_area_meta() -> Dict[str, Dict[str, Any]]:
+    """Precompute the area-invariant keyword data used for every JD and bullet."""
+    area_meta = {}
+    for area, config in JDAssessor.COMPETENCY_AREAS.items():
+        keywords_lc = tuple(keyword.lower() for keyword in config.get("keywords", []))
+        area_meta[area] = {
+            "keywords_lc": keywords_lc,
+            "keywords_set_lc": frozenset(keywords_lc),
+            "base_weight": config.get("weight", 0.2),
+            "kw_len": len(keywords_lc),
+        }
+    return area_meta
+
+
+_AREA_META = _build_area_meta()
+_EMPTY_META: Dict[str, Any] = {
+    "keywords_lc": (), "keywords_set_lc": frozenset(), "base_weight": 0.2, "kw_len": 0
+}
+
+# Fixed area order with area-indexed arrays for the per-request weight math
+_AREAS: Tuple[str, ...] = tuple(_AREA_META)
+_AREA_KEYWORDS: Tuple[Tuple[str, ...], ...] = tuple(meta["keywords_lc"] for meta in _AREA_META.values())
+_BASE_WEIGHTS: Tuple[float, ...] = tuple(meta["base_weight"] for meta in _AREA_META.values())
+_KW_LENS: Tuple[int, ...] = tuple(max(meta["kw_len"], 1) for meta in _AREA_META.values())
+
+# Every area's keywords in one matcher: each bullet is scanned once for all areas
+_AREA_MATCHER = KeywordMatcher(
+    keyword for meta in _AREA_META.values() for keyword in meta["keywords_lc"]
+)
+
+
+def _build_keyword_areas() -> Dict[str, Tuple[str, ...]]:
+    """Map each keyword to the areas that list it, for bucketing one bullet scan by area."""
+    keyword_areas: Dict[str, Tuple[str, ...]] = {}
+    for area, meta in _AREA_META.items():
+        for keyword in meta["keywords_set_lc"]:
+            keyword_areas[keyword] = keyword_areas.get(keyword, ()) + (area,)
+    return keyword_areas
+
+
+_KEYWORD_AREAS = _build_keyword_areas()
+_NO_HITS: FrozenSet[str] = frozenset()
+
+
+def _argsort_desc(values: List[float]) -> List[int]:
+    """Indexes of ``values`` by descending value; ties keep input order."""
+    return sorted(range(len(values)), key=values.__getitem__, reverse=True)
+
+
 class BulletLibrary:
     """Bullet library selection utilities."""
 
@@ -61,12 +110,16 @@ class BulletLibrary:
                 continue
             tags = bullet.get("tags") or []
             if isinstance(tags, str):
-                tags = [t.strip() for t in tags.split(",") if t.strip()]
+                # Lowercase the whole string once instead of each tag
+                tags = list(filter(None, map(str.strip, tags.lower().split(","))))
+            else:
+                tags = [t.lower() for t in tags]
             competency = bullet.get("competency")
             normalized.append({
                 "id": bullet.get("id") or text[:50],
                 "text": text,
-                "tags": [t.lower() for t in tags],
+                "text_lower": text.lower(),
+                "tags": tags,
                 "competency": competency
             })
         return normalized
@@ -75,22 +128,16 @@ class BulletLibrary:
     def _compute_competency_weights(cls, job_description: str) -> Dict[str, float]:
         """Compute JD-driven weights for each competency area."""
         jd_lower = (job_description or "").lower()
-        weights = {}
-
-        for area, config in JDAssessor.COMPETENCY_AREAS.items():
-            keywords = config.get("keywords", [])
-            mentions = sum(1 for kw in keywords if kw.lower() in jd_lower)
-            base_weight = config.get("weight", 0.2)
-            if mentions > 0:
-                weights[area] = base_weight * (mentions / max(len(keywords), 1))
-            else:
-                weights[area] = 0.0
+        # One scan of the JD for every area's keywords
+        found = _AREA_MATCHER.found(jd_lower)
+        mentions = [sum(1 for kw in keywords if kw in found) for keywords in _AREA_KEYWORDS]
+        weights = {
+            area: base_weight * (count / kw_len) if count > 0 else 0.0
+            for area, base_weight, count, kw_len in zip(_AREAS, _BASE_WEIGHTS, mentions, _KW_LENS)
+        }
 
         if sum(weights.values()) == 0:
-            weights = {
-                area: config.get("weight", 0.2)
-                for area, config in JDAssessor.COMPETENCY_AREAS.items()
-            }
+            weights = dict(zip(_AREAS, _BASE_WEIGHTS))
 
         return weights
 
@@ -102,15 +149,14 @@ class BulletLibrary:
             return {"general": total}
 
         total_weight = sum(weighted.values())
-        distribution = {}
-        for area, weight in weighted.items():
-            allocation = int((weight / total_weight) * total)
-            if allocation > 0:
-                distribution[area] = allocation
+        allocations = {
+            area: int((weight / total_weight) * total) for area, weight in weighted.items()
+        }
+        distribution = {area: count for area, count in allocations.items() if count > 0}
 
         remaining = total - sum(distribution.values())
         if remaining > 0 and distribution:
-            top_area = max(distribution.keys(), key=lambda k: distribution[k])
+            top_area = max(distribution, key=distribution.__getitem__)
             distribution[top_area] += remaining
 
         return distribution
@@ -125,15 +171,39 @@ class BulletLibrary:
         scored = []
         for bullet in bullets:
             analysis = BulletFramework.analyze_bullet(bullet["text"])
+            analysis_part = analysis.score * 0.4
+            competency = bullet.get("competency")
+
+            # One scan of the bullet, bucketed into per-area keyword hits
+            hits_by_area: Dict[str, Set[str]] = {}
+            for keyword in _AREA_MATCHER.found_words(bullet["text_lower"]):
+                for area in _KEYWORD_AREAS[keyword]:
+                    hits_by_area.setdefault(area, set()).add(keyword)
+
             area_scores = {}
             area_matches = {}
 
+            tags = bullet["tags"]
+
             for area, weight in weights.items():
-                keywords = JDAssessor.COMPETENCY_AREAS.get(area, {}).get("keywords", [])
-                keyword_score, matched = cls._keyword_score(bullet["text"], bullet["tags"], keywords)
+                meta = _AREA_META.get(area, _EMPTY_META)
+                competency_boost = 10 if competency == area else 0
+                area_hits = hits_by_area.get(area)
+
+                # No keyword or tag hits: the keyword term is zero, skip scoring it
+                if not area_hits and (not tags or meta["keywords_set_lc"].isdisjoint(tags)):
+                    area_scores[area] = round(min(100, analysis_part + competency_boost), 1)
+                    area_matches[area] = []
+                    continue
 
-                competency_boost = 10 if bullet.get("competency") == area else 0
-                combined_score = (keyword_score * 0.6) + (analysis.score * 0.4) + competency_boost
+                keyword_score, matched = cls._keyword_score(
+                    bullet["text"],
+                    tags,
+                    meta["keywords_lc"],
+                    meta["keywords_set_lc"],
+                    area_hits or _NO_HITS
+                )
+                combined_score = (keyword_score * 0.6) + analysis_part + competency_boost
                 area_scores[area] = round(min(100, combined_score), 1)
                 area_matches[area] = matched
 
@@ -158,18 +228,26 @@ class BulletLibrary:
         cls,
         text: str,
         tags: List[str],
-        keywords: List[str]
+        keywords: List[str],
+        keyword_set: Optional[FrozenSet[str]] = None,
+        found_words: Optional[AbstractSet[str]] = None
     ) -> Tuple[float, List[str]]:
-        """Score bullet against a keyword set."""
-        text_lower = text.lower()
+        """
+        Score bullet against a keyword set.
+        
+        ``keyword_set`` is the lowercased keyword set and ``found_words`` the
+        lowercased keywords already matched as whole words in ``text``; pass
+        them when precomputed.
+        """
+        if found_words is None:
+            found_words = get_keyword_matcher(tuple(keywords)).found_words(text.lower())
         matched = []
+        if found_words:
+            matched = [keyword for keyword in keywords if keyword.lower() in found_words]
 
-        for keyword in keywords:
-            pattern = r"\b" + re.escape(keyword.lower()) + r"\b"
-            if re.search(pattern, text_lower):
-                matched.append(keyword)
-
-        tag_hits = [tag for tag in tags if tag in [k.lower() for k in keywords]]
+        if keyword_set is None:
+            keyword_set = frozenset(k.lower() for k in keywords)
+        tag_hits = [tag for tag in tags if tag in keyword_set]
         raw_score = len(matched) + (0.5 * len(tag_hits))
 
         if not keywords:
@@ -182,7 +260,7 @@ class BulletLibrary:
     def _best_area(cls, area_scores: Dict[str, float]) -> Tuple[str, float]:
         if not area_scores:
             return "general", 0.0
-        best_area = max(area_scores.keys(), key=lambda k: area_scores[k])
+        best_area = max(area_scores, key=area_scores.__getitem__)
         return best_area, area_scores[best_area]
 
     @classmethod
@@ -195,18 +273,17 @@ class BulletLibrary:
         """Select bullets based on distribution and best scores."""
         selected = []
         selected_ids = set()
+        # Bullet indexes ordered by best score, shared by "general" and the top-up pass
+        best_order = _argsort_desc([b["best_score"] for b in scored])
 
         for area, target in distribution.items():
             if area == "general":
-                candidates = sorted(scored, key=lambda b: b["best_score"], reverse=True)
+                order = best_order
             else:
-                candidates = sorted(
-                    scored,
-                    key=lambda b: b["area_scores"].get(area, 0),
-                    reverse=True
-                )
+                order = _argsort_desc([b["area_scores"].get(area, 0) for b in scored])
             picked = 0
-            for bullet in candidates:
+            for index in order:
+                bullet = scored[index]
                 if bullet["id"] in selected_ids:
                     continue
                 selected.append({
@@ -223,14 +300,13 @@ class BulletLibrary:
                     break
 
         if len(selected) < total:
-            remaining = sorted(
-                [b for b in scored if b["id"] not in selected_ids],
-                key=lambda b: b["best_score"],
-                reverse=True
-            )
-            for bullet in remaining:
+            distributed_ids = frozenset(selected_ids)
+            for index in best_order:
                 if len(selected) >= total:
                     break
+                bullet = scored[index]
+                if bullet["id"] in distributed_ids:
+                    continue
                 selected.append({
                     "id": bullet["id"],
                     "text": bullet["text"],
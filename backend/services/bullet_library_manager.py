@@ -5,9 +5,12 @@ Manages reusable 6-point bullets with smart selection, storage, and CRUD operati
 Integrates with the 6-point framework for perfect quality control.
 """
 
-from typing import Dict, List, Optional
+import heapq
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from datetime import datetime
-import uuid
+import itertools
+import time
+from performance_utils import get_keyword_matcher
 from schemas import (
     SixPointBullet,
     BulletLibraryItem,
@@ -16,6 +19,16 @@ from schemas import (
 )
 from services.bullet_validator import BulletValidator
 from services.competency_assessor import CompetencyAssessor
+from services.spinning_service import SpinningStrategy
+
+
+# Stage-appropriate verbs and keywords from the spinning dictionaries. Built
+# once over the known stages, so client-supplied stage strings add no entries.
+_NO_STAGE_TERMS: Tuple[Tuple[str, ...], Tuple[str, ...]] = ((), ())
+_STAGE_TERMS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    stage: (tuple(terms.get("verbs", [])), tuple(terms.get("keywords", [])))
+    for stage, terms in SpinningStrategy.DICTIONARIES.items()
+}
 
 
 class BulletLibraryManager:
@@ -24,6 +37,118 @@ class BulletLibraryManager:
     # In-memory storage (replace with database in production)
     _storage: Dict[str, BulletLibraryItem] = {}
     
+    # Process-local sequence for generated bullet IDs
+    _id_counter = itertools.count()
+    
+    # Secondary indexes over _storage, kept in sync by add/update/delete
+    _by_competency: Dict[str, Set[str]] = {}
+    _by_stage: Dict[str, Set[str]] = {}
+    _by_tag: Dict[str, Set[str]] = {}
+    _tag_sets: Dict[str, FrozenSet[str]] = {}
+    # Lowercased assembled text per bullet, for relevance scoring
+    _text_lower: Dict[str, str] = {}
+    _sorted_by_quality: Optional[List[BulletLibraryItem]] = None
+    
+    # Running aggregates for get_statistics
+    _comp_counts: Dict[str, int] = {}
+    _stage_counts: Dict[str, int] = {}
+    _quality_sum: int = 0
+    _usage_sum: int = 0
+    # Max-heap of (-usage_count, storage position, id); stale entries are skipped lazily
+    _by_usage: List[Tuple[int, int, str]] = []
+    _positions: Dict[str, int] = {}
+    _next_position: int = 0
+    
+    @classmethod
+    def _new_id(cls) -> str:
+        """Generate a bullet ID without a uuid4 urandom call."""
+        return f"b-{next(cls._id_counter):x}-{int(time.time()):x}"
+    
+    @classmethod
+    def _index(cls, item: BulletLibraryItem) -> None:
+        """Add a stored item to the secondary indexes and aggregates."""
+        bullet = item.bullet
+        cls._by_competency.setdefault(bullet.competency, set()).add(item.id)
+        cls._by_stage.setdefault(bullet.company_stage, set()).add(item.id)
+        for tag in bullet.tags:
+            cls._by_tag.setdefault(tag, set()).add(item.id)
+        cls._tag_sets[item.id] = frozenset(bullet.tags)
+        cls._text_lower[item.id] = BulletValidator._assemble_bullet(bullet).lower()
+        cls._sorted_by_quality = None
+        
+        comp = bullet.competency or "uncategorized"
+        cls._comp_counts[comp] = cls._comp_counts.get(comp, 0) + 1
+        stage = bullet.company_stage or "any"
+        cls._stage_counts[stage] = cls._stage_counts.get(stage, 0) + 1
+        cls._quality_sum += item.quality_score
+        cls._usage_sum += item.usage_count
+        if item.id not in cls._positions:
+            cls._positions[item.id] = cls._next_position
+            cls._next_position += 1
+        cls._push_usage(item)
+    
+    @classmethod
+    def _unindex(cls, item: BulletLibraryItem) -> None:
+        """Remove a stored item from the secondary indexes and aggregates."""
+        bullet = item.bullet
+        cls._by_competency.get(bullet.competency, set()).discard(item.id)
+        cls._by_stage.get(bullet.company_stage, set()).discard(item.id)
+        for tag in bullet.tags:
+            cls._by_tag.get(tag, set()).discard(item.id)
+        cls._tag_sets.pop(item.id, None)
+        cls._text_lower.pop(item.id, None)
+        cls._sorted_by_quality = None
+        
+        cls._decrement(cls._comp_counts, bullet.competency or "uncategorized")
+        cls._decrement(cls._stage_counts, bullet.company_stage or "any")
+        cls._quality_sum -= item.quality_score
+        cls._usage_sum -= item.usage_count
+    
+    @staticmethod
+    def _decrement(counts: Dict[str, int], key: str) -> None:
+        """Decrement a running count, dropping keys that reach zero."""
+        if counts.get(key, 0) > 1:
+            counts[key] -= 1
+        else:
+            counts.pop(key, None)
+    
+    @classmethod
+    def _push_usage(cls, item: BulletLibraryItem) -> None:
+        """Record an item's current usage count in the most-used heap."""
+        heapq.heappush(cls._by_usage, (-item.usage_count, cls._positions[item.id], item.id))
+        # Rebuild from live items once stale entries dominate
+        if len(cls._by_usage) > 2 * len(cls._storage) + 64:
+            cls._by_usage = [
+                (-live.usage_count, cls._positions[bullet_id], bullet_id)
+                for bullet_id, live in cls._storage.items()
+            ]
+            heapq.heapify(cls._by_usage)
+    
+    @classmethod
+    def _most_used(cls) -> Optional[BulletLibraryItem]:
+        """Most-used stored item; ties go to the earliest stored, like max()."""
+        heap = cls._by_usage
+        while heap:
+            neg_usage, position, bullet_id = heap[0]
+            item = cls._storage.get(bullet_id)
+            if (
+                item is not None
+                and item.usage_count == -neg_usage
+                and cls._positions.get(bullet_id) == position
+            ):
+                return item
+            heapq.heappop(heap)
+        return None
+    
+    @classmethod
+    def _quality_view(cls) -> List[BulletLibraryItem]:
+        """Stored items by descending quality score, rebuilt only after writes."""
+        if cls._sorted_by_quality is None:
+            cls._sorted_by_quality = sorted(
+                cls._storage.values(), key=lambda b: b.quality_score, reverse=True
+            )
+        return cls._sorted_by_quality
+    
     @classmethod
     def add_bullet(
         cls,
@@ -57,7 +182,7 @@ class BulletLibraryManager:
                 return result
         
         # Generate ID
-        bullet_id = bullet.id or str(uuid.uuid4())
+        bullet_id = bullet.id or cls._new_id()
         
         # Create library item
         library_item = BulletLibraryItem(
@@ -69,7 +194,10 @@ class BulletLibraryManager:
         )
         
         # Store
+        if bullet_id in cls._storage:
+            cls._unindex(cls._storage[bullet_id])
         cls._storage[bullet_id] = library_item
+        cls._index(library_item)
         
         result["success"] = True
         result["bullet_id"] = bullet_id
@@ -108,8 +236,10 @@ class BulletLibraryManager:
         
         # Update the bullet
         existing = cls._storage[bullet_id]
+        cls._unindex(existing)
         existing.bullet = bullet
         existing.quality_score = validation.quality_score if validate else existing.quality_score
+        cls._index(existing)
         
         return {
             "success": True,
@@ -126,7 +256,8 @@ class BulletLibraryManager:
                 "message": f"Bullet {bullet_id} not found"
             }
         
-        del cls._storage[bullet_id]
+        cls._unindex(cls._storage.pop(bullet_id))
+        del cls._positions[bullet_id]
         
         return {
             "success": True,
@@ -153,26 +284,36 @@ class BulletLibraryManager:
         Returns:
             List of matching bullets
         """
-        bullets = list(cls._storage.values())
-        
-        # Apply filters
+        # Narrow candidate ids through the secondary indexes
+        candidates: Optional[Set[str]] = None
         if competency:
-            bullets = [b for b in bullets if b.bullet.competency == competency]
+            candidates = cls._by_competency.get(competency, set())
         
         if company_stage:
-            bullets = [b for b in bullets if b.bullet.company_stage == company_stage]
-        
-        if min_quality > 0:
-            bullets = [b for b in bullets if b.quality_score >= min_quality]
+            stage_ids = cls._by_stage.get(company_stage, set())
+            candidates = stage_ids if candidates is None else candidates & stage_ids
         
         if tags:
-            bullets = [
-                b for b in bullets
-                if any(tag in b.bullet.tags for tag in tags)
-            ]
+            query_tags = frozenset(tags)
+            if candidates is None:
+                candidates = set().union(*(cls._by_tag.get(tag, ()) for tag in query_tags))
+            else:
+                # Already narrowed: test each candidate's tag set instead of unioning tag indexes
+                candidates = {
+                    bullet_id for bullet_id in candidates
+                    if not query_tags.isdisjoint(cls._tag_sets[bullet_id])
+                }
+        
+        if candidates is not None and not candidates:
+            return []
         
-        # Sort by quality score
-        bullets.sort(key=lambda b: b.quality_score, reverse=True)
+        # Walk the quality-sorted view, stopping below the quality cutoff
+        bullets = []
+        for item in cls._quality_view():
+            if min_quality > 0 and item.quality_score < min_quality:
+                break
+            if candidates is None or item.id in candidates:
+                bullets.append(item)
         
         return bullets
     
@@ -190,7 +331,7 @@ class BulletLibraryManager:
         Returns:
             Dict with selected bullets and metadata
         """
-        # Assess the JD
+        # Assess the JD (memoized by CompetencyAssessor; each call gets its own copy)
         jd_assessment = CompetencyAssessor.assess_job_description(
             jd_text=criteria.job_description,
             skills=criteria.target_competencies
@@ -211,17 +352,22 @@ class BulletLibraryManager:
             }
         
         # Score bullets against JD competencies
+        stage_terms = _STAGE_TERMS.get(criteria.company_stage, _NO_STAGE_TERMS)
         scored_bullets = []
         for lib_item in all_bullets:
             bullet = lib_item.bullet
-            full_text = BulletValidator._assemble_bullet(bullet)
+            bullet_lower = cls._text_lower.get(lib_item.id)
+            if bullet_lower is None:
+                bullet_lower = BulletValidator._assemble_bullet(bullet).lower()
             
             # Calculate relevance score
             relevance = cls._calculate_relevance(
-                bullet_text=full_text,
+                bullet_text=bullet_lower,
+                bullet_lower=bullet_lower,
                 competency=bullet.competency,
                 jd_competencies=jd_assessment["competencies"],
-                target_stage=criteria.company_stage
+                target_stage=criteria.company_stage,
+                stage_terms=stage_terms
             )
             
             # Apply usage penalty if preferring unused bullets
@@ -250,12 +396,16 @@ class BulletLibraryManager:
                 jd_competencies=jd_assessment["competencies"]
             )
         
-        # Mark bullets as used
+        # Mark bullets as used, with one timestamp for the whole selection
+        now_iso = datetime.now().isoformat()
         for item in selected:
             bullet_id = item["bullet_item"].id
             if bullet_id in cls._storage:
-                cls._storage[bullet_id].usage_count += 1
-                cls._storage[bullet_id].last_used = datetime.now().isoformat()
+                stored = cls._storage[bullet_id]
+                stored.usage_count += 1
+                stored.last_used = now_iso
+                cls._usage_sum += 1
+                cls._push_usage(stored)
         
         return {
             "selected_bullets": [
@@ -280,39 +430,44 @@ class BulletLibraryManager:
         bullet_text: str,
         competency: str,
         jd_competencies: List[Dict],
-        target_stage: Optional[str]
+        target_stage: Optional[str],
+        stage_terms: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None,
+        bullet_lower: Optional[str] = None
     ) -> float:
-        """Calculate how relevant a bullet is to the JD"""
+        """
+        Calculate how relevant a bullet is to the JD.
+        
+        ``stage_terms`` is the (verbs, keywords) pair for ``target_stage``;
+        pass it when scoring many bullets for the same stage. ``bullet_lower``
+        is the already-lowercased ``bullet_text``, when cached.
+        """
         score = 0.0
         
-        bullet_lower = bullet_text.lower()
+        if bullet_lower is None:
+            bullet_lower = bullet_text.lower()
         
         # Score based on competency match
+        competency_keywords: Tuple[str, ...] = ()
         for jd_comp in jd_competencies:
             if jd_comp["name"] == competency:
                 # High relevance if competency matches
                 score += 50
-                
-                # Additional score for keyword matches
-                for keyword in jd_comp.get("keywords_found", []):
-                    if keyword in bullet_lower:
-                        score += 5
-                
+                competency_keywords = tuple(jd_comp.get("keywords_found", []))
                 break
         
-        # Stage boost
-        if target_stage:
-            from services.spinning_service import SpinningStrategy
-            stage_dict = SpinningStrategy.DICTIONARIES.get(target_stage, {})
-            
-            # Check for stage-appropriate verbs and keywords
-            for verb in stage_dict.get("verbs", []):
-                if verb in bullet_lower:
-                    score += 3
-            
-            for keyword in stage_dict.get("keywords", []):
-                if keyword in bullet_lower:
-                    score += 2
+        # Stage-appropriate verbs and keywords
+        if stage_terms is None:
+            stage_terms = _STAGE_TERMS.get(target_stage, _NO_STAGE_TERMS)
+        stage_verbs, stage_keywords = stage_terms
+        
+        # One scan of the bullet for all three term lists. The matcher reports
+        # lowercased terms, so mixed-case entries never match lowered text.
+        terms = competency_keywords + stage_verbs + stage_keywords
+        if terms:
+            found = get_keyword_matcher(terms).found(bullet_lower)
+            score += 5 * sum(1 for keyword in competency_keywords if keyword in found)
+            score += 3 * sum(1 for verb in stage_verbs if verb in found)
+            score += 2 * sum(1 for keyword in stage_keywords if keyword in found)
         
         return min(100.0, score)
     
@@ -327,38 +482,43 @@ class BulletLibraryManager:
         selected = []
         bullets_by_comp = {}
         
-        # Group bullets by competency
+        # Group bullets by competency (each group stays in final-score order)
         for item in scored_bullets:
             comp = item["bullet_item"].bullet.competency or "general"
             if comp not in bullets_by_comp:
                 bullets_by_comp[comp] = []
             bullets_by_comp[comp].append(item)
         
+        # Next unpicked position per competency; groups are never copied or trimmed
+        cursors = dict.fromkeys(bullets_by_comp, 0)
+        top_comp = jd_competencies[0]["name"] if jd_competencies else None
+        
         # Distribute according to pattern (e.g., [3, 3, 3, 2, 2])
         for count in distribution:
-            # Pick from top competency if available
-            if jd_competencies:
-                top_comp = jd_competencies[0]["name"]
-                if top_comp in bullets_by_comp and bullets_by_comp[top_comp]:
-                    selected.extend(bullets_by_comp[top_comp][:count])
-                    bullets_by_comp[top_comp] = bullets_by_comp[top_comp][count:]
+            # Pick from top competency if available, else fall back to best available
+            if top_comp in bullets_by_comp and cursors[top_comp] < len(bullets_by_comp[top_comp]):
+                comp = top_comp
+            else:
+                comp = next(
+                    (c for c, items in bullets_by_comp.items() if cursors[c] < len(items)),
+                    None
+                )
+                if comp is None:
                     continue
             
-            # Fallback to best available
-            for comp_list in bullets_by_comp.values():
-                if comp_list:
-                    selected.extend(comp_list[:count])
-                    comp_list[:] = comp_list[count:]
-                    break
+            start = cursors[comp]
+            chunk = bullets_by_comp[comp][start:start + count]
+            selected.extend(chunk)
+            cursors[comp] = start + len(chunk)
         
         return selected
     
     @classmethod
     def get_statistics(cls) -> Dict:
-        """Get library statistics"""
-        bullets = list(cls._storage.values())
+        """Get library statistics from the running aggregates"""
+        total = len(cls._storage)
         
-        if not bullets:
+        if not total:
             return {
                 "total_bullets": 0,
                 "avg_quality": 0,
@@ -367,23 +527,13 @@ class BulletLibraryManager:
                 "total_usage": 0
             }
         
-        competency_dist = {}
-        stage_dist = {}
-        
-        for item in bullets:
-            comp = item.bullet.competency or "uncategorized"
-            competency_dist[comp] = competency_dist.get(comp, 0) + 1
-            
-            stage = item.bullet.company_stage or "any"
-            stage_dist[stage] = stage_dist.get(stage, 0) + 1
-        
         return {
-            "total_bullets": len(bullets),
-            "avg_quality": sum(b.quality_score for b in bullets) / len(bullets),
-            "competency_distribution": competency_dist,
-            "stage_distribution": stage_dist,
-            "total_usage": sum(b.usage_count for b in bullets),
-            "most_used": max(bullets, key=lambda b: b.usage_count) if bullets else None
+            "total_bullets": total,
+            "avg_quality": cls._quality_sum / total,
+            "competency_distribution": dict(cls._comp_counts),
+            "stage_distribution": dict(cls._stage_counts),
+            "total_usage": cls._usage_sum,
+            "most_used": cls._most_used()
         }
 
 
@@ -6,7 +6,11 @@ Ensures every bullet meets quality standards before being used.
 """
 
 import re
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from performance_utils import KeywordMatcher
 from schemas import (
     SixPointBullet, 
     BulletValidationResult, 
@@ -14,37 +18,175 @@ from schemas import (
 )
 
 
+# Metric patterns fused into one alternation; the group name is the metric type.
+# Only the ratio branch ignores case, so "5m" is not read as a scaled number.
+# Every branch starts with a digit or "$": the leading lookahead lets the regex
+# engine skip straight to candidate positions instead of trying each branch at
+# every character.
+_RE_METRICS = re.compile(
+    r'(?=[\d$])'
+    r'(?:(?P<percentage>\d+(?:\.\d+)?%)'
+    r'|(?P<dollar>\$\d+(?:,\d{3})*(?:\.\d{2})?[KMB]?)'
+    r'|(?P<scaled_number>\d+(?:\.\d+)?[KMB](?:\+)?)'
+    r'|(?P<number>\d+(?:,\d{3})+)'
+    r'|(?P<ratio>(?i:\d+:\d+|\d+x)))'
+)
+_RE_PLAIN_NUMBER = re.compile(r'(?=\d)\b\d+\b')
+
+# Suggestions returned whenever text has no metrics
+_METRIC_SUGGESTIONS = (
+    "Add specific numbers: How many? How much?",
+    "Include percentages: By what %?",
+    "Quantify impact: How many users, dollars, hours saved?",
+    "Example: 'reduced time by 40%', 'grew revenue by $500K', 'served 10K+ users'"
+)
+
+
+# Character count requirements. Module-level so the hot checks read them as
+# globals; BulletValidator keeps same-named aliases for existing callers.
+MIN_CHARS = 240
+MAX_CHARS = 260
+IDEAL_CHARS = 250
+
+# Strong action verbs (recommended starters)
+STRONG_VERBS = [
+    "led", "built", "designed", "developed", "created", "established",
+    "launched", "implemented", "architected", "drove", "spearheaded",
+    "orchestrated", "pioneered", "transformed", "optimized", "scaled",
+    "increased", "reduced", "improved", "accelerated", "delivered",
+    "achieved", "exceeded", "generated", "streamlined", "automated",
+    "coordinated", "facilitated", "managed", "directed", "executed"
+]
+
+# Weak/generic verbs to avoid
+WEAK_VERBS = [
+    "helped", "worked on", "responsible for", "assisted with",
+    "participated in", "contributed to", "involved in", "dealt with",
+    "handled", "did", "made", "got", "had"
+]
+
+# Verbs offered when a weak one is found
+_STRONG_VERB_HINT = ', '.join(STRONG_VERBS[:5])
+
+# Set views for O(1) first-word membership tests
+_STRONG_VERB_SET = frozenset(STRONG_VERBS)
+_WEAK_VERB_SET = frozenset(WEAK_VERBS)
+# Prefixes for a strong verb followed by more words, for str.startswith
+_STRONG_VERB_PREFIXES = tuple(verb + " " for verb in STRONG_VERBS)
+
+# One whole-word scan for every weak verb, longest phrase first, so
+# "handled" no longer matches inside "mishandled"
+_WEAK_VERB_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(WEAK_VERBS, key=len, reverse=True))) + r')\b'
+)
+
+# Generic/weak phrases to avoid
+GENERIC_PHRASES = [
+    "various tasks", "day-to-day", "as needed", "duties included",
+    "worked closely", "team player", "hard worker", "detail-oriented",
+    "self-starter", "go-getter", "think outside the box"
+]
+_GENERIC_MATCHER = KeywordMatcher(GENERIC_PHRASES)
+
+# Character-count points for every in-range length, offset by MIN_CHARS:
+# 10 for being in range plus a 5-point bonus within 5 of IDEAL_CHARS
+_CHAR_COUNT_POINTS = tuple(
+    10 + (5 if abs(count - IDEAL_CHARS) <= 5 else 0)
+    for count in range(MIN_CHARS, MAX_CHARS + 1)
+)
+
+
+# Labels for the six points, in framework order
+_FIELD_NAMES = ("Action", "Context", "Method", "Result", "Impact", "Outcome")
+
+# Simple mapping of weak to strong verbs, checked in order
+_WEAK_TO_STRONG = (
+    ("helped", "Enabled"),
+    ("worked on", "Developed"),
+    ("assisted", "Supported"),
+    ("responsible for", "Managed"),
+    ("participated", "Contributed"),
+    ("handled", "Managed"),
+    ("did", "Executed"),
+    ("made", "Created")
+)
+
+
+class CharCountStatus(IntEnum):
+    """Where a bullet's character count falls relative to the allowed range"""
+    OK = 0
+    TOO_SHORT = 1
+    TOO_LONG = 2
+    NEAR_MIN = 3
+    NEAR_MAX = 4
+
+
+@dataclass(slots=True)
+class BulletBatch:
+    """
+    Column-wise (struct-of-arrays) view of many bullets for bulk validation.
+    
+    Each list holds one of the six points, aligned by index, so a batch pass
+    reads plain strings instead of six attributes off every bullet model.
+    """
+    actions: List[str] = field(default_factory=list)
+    contexts: List[str] = field(default_factory=list)
+    methods: List[str] = field(default_factory=list)
+    results: List[str] = field(default_factory=list)
+    impacts: List[str] = field(default_factory=list)
+    outcomes: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def from_bullets(cls, bullets: List[SixPointBullet]) -> "BulletBatch":
+        """Split bullets into the six field columns"""
+        batch = cls()
+        for bullet in bullets:
+            batch.append(bullet)
+        return batch
+    
+    def append(self, bullet: SixPointBullet) -> None:
+        """Add one bullet to the end of every column"""
+        self.actions.append(bullet.action)
+        self.contexts.append(bullet.context)
+        self.methods.append(bullet.method)
+        self.results.append(bullet.result)
+        self.impacts.append(bullet.impact)
+        self.outcomes.append(bullet.outcome)
+    
+    def __len__(self) -> int:
+        return len(self.actions)
+    
+    def rows(self) -> Iterator[Tuple[str, ...]]:
+        """Iterate each bullet's six fields as a tuple, in framework order"""
+        return zip(
+            self.actions, self.contexts, self.methods,
+            self.results, self.impacts, self.outcomes
+        )
+
+
+@lru_cache(maxsize=512)
+def _strong_verb_for(action_lower: str) -> str:
+    """Strong replacement for the first weak verb found in a lowercased action."""
+    for weak, strong in _WEAK_TO_STRONG:
+        if weak in action_lower:
+            return strong
+    
+    # Default suggestion
+    return "Led"
+
+
 class BulletValidator:
     """Validates bullets against the 6-point framework and quality standards"""
     
     # Character count requirements
-    MIN_CHARS = 240
-    MAX_CHARS = 260
-    IDEAL_CHARS = 250
-    
-    # Strong action verbs (recommended starters)
-    STRONG_VERBS = [
-        "led", "built", "designed", "developed", "created", "established",
-        "launched", "implemented", "architected", "drove", "spearheaded",
-        "orchestrated", "pioneered", "transformed", "optimized", "scaled",
-        "increased", "reduced", "improved", "accelerated", "delivered",
-        "achieved", "exceeded", "generated", "streamlined", "automated",
-        "coordinated", "facilitated", "managed", "directed", "executed"
-    ]
-    
-    # Weak/generic verbs to avoid
-    WEAK_VERBS = [
-        "helped", "worked on", "responsible for", "assisted with",
-        "participated in", "contributed to", "involved in", "dealt with",
-        "handled", "did", "made", "got", "had"
-    ]
+    MIN_CHARS = MIN_CHARS
+    MAX_CHARS = MAX_CHARS
+    IDEAL_CHARS = IDEAL_CHARS
     
-    # Generic/weak phrases to avoid
-    GENERIC_PHRASES = [
-        "various tasks", "day-to-day", "as needed", "duties included",
-        "worked closely", "team player", "hard worker", "detail-oriented",
-        "self-starter", "go-getter", "think outside the box"
-    ]
+    # Verb and phrase lists
+    STRONG_VERBS = STRONG_VERBS
+    WEAK_VERBS = WEAK_VERBS
+    GENERIC_PHRASES = GENERIC_PHRASES
     
     @classmethod
     def validate_bullet(cls, bullet: SixPointBullet) -> BulletValidationResult:
@@ -57,42 +199,91 @@ class BulletValidator:
         Returns:
             BulletValidationResult with detailed feedback
         """
+        return cls._validate_fields(
+            bullet.action,
+            bullet.context,
+            bullet.method,
+            bullet.result,
+            bullet.impact,
+            bullet.outcome
+        )
+    
+    @classmethod
+    def _validate_fields(
+        cls,
+        action: str,
+        context: str,
+        method: str,
+        result: str,
+        impact: str,
+        outcome: str
+    ) -> BulletValidationResult:
+        """
+        Validate a bullet given as its six field values.
+        
+        A bullet missing any field, or under half the minimum length, is
+        rejected after the field and length checks with a quality score of 0;
+        the checks it skips report False.
+        """
         errors = []
         warnings = []
         suggestions = []
         auto_fix = {}
         
         # Assemble the full bullet text
-        full_text = cls._assemble_bullet(bullet)
+        full_text = cls._assemble_fields(action, context, method, result, impact, outcome)
         char_count = len(full_text)
         
         # Check 1: All 6 points present
-        all_six_points = cls._check_all_six_points(bullet, errors)
+        all_six_points = cls._check_all_six_points(
+            (action, context, method, result, impact, outcome), errors
+        )
         
         # Check 2: Character count
-        char_count_valid = cls._check_character_count(char_count, errors, warnings, suggestions)
-        
-        # Check 3: Metrics presence
-        metrics_result = cls._detect_metrics(full_text)
-        has_metrics = metrics_result.has_metrics
+        char_count_status = cls._check_character_count(char_count, errors, warnings, suggestions)
+        char_count_valid = char_count_status not in (CharCountStatus.TOO_SHORT, CharCountStatus.TOO_LONG)
+        
+        # Fast path: a bullet missing fields or far too short cannot pass, so
+        # skip the metric, verb and phrase scans and report it as rejected
+        if not all_six_points or char_count < MIN_CHARS // 2:
+            return BulletValidationResult(
+                is_valid=False,
+                character_count=char_count,
+                has_metrics=False,
+                has_all_six_points=all_six_points,
+                has_strong_verb=False,
+                no_generic_language=False,
+                quality_score=0,
+                errors=errors,
+                warnings=warnings,
+                suggestions=suggestions
+            )
+        
+        # Check 3: Metrics presence. The assembled text contains the result, so
+        # a metric in the short result field settles it without scanning the
+        # rest; the result scan is reused for check 6.
+        result_metric = bool(result) and cls._has_any_metric(result)
+        has_metrics = result_metric or cls._has_any_metric(full_text)
         if not has_metrics:
             errors.append("Bullet must contain metrics (numbers, percentages, dollar amounts)")
-            suggestions.extend(metrics_result.suggestions_if_missing)
+            suggestions.extend(_METRIC_SUGGESTIONS)
         
         # Check 4: Strong action verb
-        strong_verb = cls._check_action_verb(bullet.action, warnings, suggestions)
+        strong_verb = cls._check_action_verb(action, warnings, suggestions)
         
         # Check 5: No generic language
         no_generic = cls._check_generic_language(full_text, warnings, suggestions)
         
         # Check 6: Result field has metrics
-        result_has_metrics = cls._check_result_has_metrics(bullet.result, errors, suggestions)
+        result_has_metrics = cls._check_result_has_metrics(
+            result, errors, suggestions, has_metric=result_metric
+        )
         
         # Check 7: Method is descriptive
-        cls._check_method_quality(bullet.method, warnings, suggestions)
+        cls._check_method_quality(method, warnings, suggestions)
         
         # Check 8: Impact is meaningful
-        cls._check_impact_quality(bullet.impact, warnings, suggestions)
+        cls._check_impact_quality(impact, warnings, suggestions)
         
         # Calculate quality score
         quality_score = cls._calculate_quality_score(
@@ -106,12 +297,12 @@ class BulletValidator:
         
         # Auto-fix suggestions
         auto_fix_available = False
-        if char_count > cls.MAX_CHARS:
-            auto_fix["character_count"] = f"Trim to {cls.MAX_CHARS} characters"
+        if char_count_status == CharCountStatus.TOO_LONG:
+            auto_fix["character_count"] = f"Trim to {MAX_CHARS} characters"
             auto_fix_available = True
         
-        if not strong_verb and bullet.action:
-            similar_strong = cls._suggest_strong_verb(bullet.action)
+        if not strong_verb and action:
+            similar_strong = cls._suggest_strong_verb(action)
             if similar_strong:
                 auto_fix["action_verb"] = f"Replace with: {similar_strong}"
                 auto_fix_available = True
@@ -139,56 +330,76 @@ class BulletValidator:
             auto_fix_suggestions=auto_fix
         )
     
+    @classmethod
+    def validate_bullets(cls, bullets: List[SixPointBullet]) -> List[BulletValidationResult]:
+        """
+        Validate a batch of bullets, e.g. every bullet on a resume.
+        
+        Bullets with identical fields are validated once and share the same
+        result object, so treat the results as read-only.
+        """
+        return cls.validate_batch(BulletBatch.from_bullets(bullets))
+    
+    @classmethod
+    def validate_batch(cls, batch: BulletBatch) -> List[BulletValidationResult]:
+        """
+        Validate every bullet in a column-wise batch, returning results in order.
+        
+        Rows with identical fields are validated once and share the same
+        result object, so treat the results as read-only.
+        """
+        results: Dict[Tuple[str, ...], BulletValidationResult] = {}
+        validations = []
+        for row in batch.rows():
+            validation = results.get(row)
+            if validation is None:
+                validation = results[row] = cls._validate_fields(*row)
+            validations.append(validation)
+        return validations
+    
     @classmethod
     def _assemble_bullet(cls, bullet: SixPointBullet) -> str:
         """Assemble the 6 points into a single bullet text"""
-        parts = [
+        return cls._assemble_fields(
             bullet.action,
             bullet.context,
             bullet.method,
             bullet.result,
             bullet.impact,
             bullet.outcome
-        ]
-        
+        )
+    
+    @staticmethod
+    def _assemble_fields(
+        action: str,
+        context: str,
+        method: str,
+        result: str,
+        impact: str,
+        outcome: str
+    ) -> str:
         # Join with smart punctuation
-        text = f"{bullet.action} {bullet.context}"
-        
-        if bullet.method:
-            text += f", {bullet.method}"
-        
-        if bullet.result:
-            text += f", {bullet.result}"
-        
-        if bullet.impact:
-            text += f", {bullet.impact}"
-        
-        if bullet.outcome:
-            text += f" {bullet.outcome}"
-        
-        # Clean up spacing
-        text = re.sub(r'\s+', ' ', text).strip()
-        text = re.sub(r'\s+,', ',', text)
+        text = ''.join((
+            action, ' ', context,
+            ', ' if method else '', method,
+            ', ' if result else '', result,
+            ', ' if impact else '', impact,
+            ' ' if outcome else '', outcome
+        ))
+        
+        # Clean up spacing: collapse whitespace runs, then drop spaces before commas
+        text = ' '.join(text.split())
+        text = text.replace(' ,', ',')
         
         return text
     
     @classmethod
-    def _check_all_six_points(cls, bullet: SixPointBullet, errors: List[str]) -> bool:
-        """Check if all 6 points are present and non-empty"""
-        missing = []
-        
-        if not bullet.action or len(bullet.action.strip()) == 0:
-            missing.append("Action")
-        if not bullet.context or len(bullet.context.strip()) == 0:
-            missing.append("Context")
-        if not bullet.method or len(bullet.method.strip()) == 0:
-            missing.append("Method")
-        if not bullet.result or len(bullet.result.strip()) == 0:
-            missing.append("Result")
-        if not bullet.impact or len(bullet.impact.strip()) == 0:
-            missing.append("Impact")
-        if not bullet.outcome or len(bullet.outcome.strip()) == 0:
-            missing.append("Outcome")
+    def _check_all_six_points(cls, values: Tuple[str, ...], errors: List[str]) -> bool:
+        """Check if all 6 points (given in framework order) are present and non-empty"""
+        missing = [
+            name for name, value in zip(_FIELD_NAMES, values)
+            if not value or value.isspace()
+        ]
         
         if missing:
             errors.append(f"Missing required fields: {', '.join(missing)}")
@@ -203,89 +414,60 @@ class BulletValidator:
         errors: List[str], 
         warnings: List[str],
         suggestions: List[str]
-    ) -> bool:
+    ) -> CharCountStatus:
         """Check if character count is within acceptable range"""
-        if count < cls.MIN_CHARS:
-            errors.append(f"Bullet too short ({count} chars). Must be at least {cls.MIN_CHARS} characters.")
+        if count < MIN_CHARS:
+            errors.append(f"Bullet too short ({count} chars). Must be at least {MIN_CHARS} characters.")
             suggestions.append("Add more detail to context, method, or impact")
-            return False
+            return CharCountStatus.TOO_SHORT
         
-        if count > cls.MAX_CHARS:
-            errors.append(f"Bullet too long ({count} chars). Must be under {cls.MAX_CHARS} characters.")
+        if count > MAX_CHARS:
+            errors.append(f"Bullet too long ({count} chars). Must be under {MAX_CHARS} characters.")
             suggestions.append("Trim less important details or use more concise language")
-            return False
+            return CharCountStatus.TOO_LONG
         
-        if count < cls.MIN_CHARS + 10:
+        if count < MIN_CHARS + 10:
             warnings.append(f"Bullet is close to minimum length ({count} chars)")
+            return CharCountStatus.NEAR_MIN
         
-        if count > cls.MAX_CHARS - 10:
+        if count > MAX_CHARS - 10:
             warnings.append(f"Bullet is close to maximum length ({count} chars)")
+            return CharCountStatus.NEAR_MAX
         
-        return True
+        return CharCountStatus.OK
+    
+    @classmethod
+    def _has_any_metric(cls, text: str) -> bool:
+        """Whether ``_detect_metrics`` would find a metric, stopping at the first hit"""
+        return _RE_METRICS.search(text) is not None or _RE_PLAIN_NUMBER.search(text) is not None
     
     @classmethod
     def _detect_metrics(cls, text: str) -> MetricsDetectionResult:
         """Detect metrics (numbers, percentages, dollar amounts) in text"""
         metrics = []
-        metric_types = []
-        
-        # Percentage pattern
-        percentage_pattern = r'\d+(?:\.\d+)?%'
-        percentages = re.findall(percentage_pattern, text)
-        if percentages:
-            metrics.extend(percentages)
-            metric_types.append("percentage")
-        
-        # Dollar amount pattern
-        dollar_pattern = r'\$\d+(?:,\d{3})*(?:\.\d{2})?[KMB]?'
-        dollars = re.findall(dollar_pattern, text)
-        if dollars:
-            metrics.extend(dollars)
-            metric_types.append("dollar")
-        
-        # Large numbers with commas
-        number_pattern = r'\d+(?:,\d{3})+'
-        large_numbers = re.findall(number_pattern, text)
-        if large_numbers:
-            metrics.extend(large_numbers)
-            metric_types.append("number")
-        
-        # Numbers with units (M, K, B for millions, thousands, billions)
-        unit_pattern = r'\d+(?:\.\d+)?[KMB](?:\+)?'
-        unit_numbers = re.findall(unit_pattern, text)
-        if unit_numbers:
-            metrics.extend(unit_numbers)
-            metric_types.append("scaled_number")
-        
-        # Ratios (e.g., 3:1, 5x)
-        ratio_pattern = r'\d+:\d+|\d+x'
-        ratios = re.findall(ratio_pattern, text, re.IGNORECASE)
-        if ratios:
-            metrics.extend(ratios)
-            metric_types.append("ratio")
+        metric_types = set()
+        
+        # Single pass: percentages, dollar amounts, scaled numbers (K/M/B),
+        # large numbers with commas, and ratios (e.g., 3:1, 5x)
+        for match in _RE_METRICS.finditer(text):
+            metrics.append(match.group())
+            metric_types.add(match.lastgroup)
         
         # Plain numbers (as backup)
         if not metrics:
-            plain_numbers = re.findall(r'\b\d+\b', text)
+            plain_numbers = _RE_PLAIN_NUMBER.findall(text)
             if plain_numbers:
                 metrics.extend(plain_numbers[:3])  # Limit to first 3
-                metric_types.append("plain_number")
+                metric_types.add("plain_number")
         
         has_metrics = len(metrics) > 0
         
-        suggestions = []
-        if not has_metrics:
-            suggestions = [
-                "Add specific numbers: How many? How much?",
-                "Include percentages: By what %?",
-                "Quantify impact: How many users, dollars, hours saved?",
-                "Example: 'reduced time by 40%', 'grew revenue by $500K', 'served 10K+ users'"
-            ]
+        suggestions = [] if has_metrics else list(_METRIC_SUGGESTIONS)
         
         return MetricsDetectionResult(
             has_metrics=has_metrics,
             metrics_found=metrics,
-            metric_types=list(set(metric_types)),
+            metric_types=list(metric_types),
             suggestions_if_missing=suggestions
         )
     
@@ -301,16 +483,15 @@ class BulletValidator:
             return False
         
         action_lower = action.lower().strip()
-        first_word = action_lower.split()[0] if action_lower.split() else ""
         
         # Check if starts with weak verb
-        if any(weak in action_lower for weak in cls.WEAK_VERBS):
+        if _WEAK_VERB_RE.search(action_lower):
             warnings.append(f"Weak action verb: '{action}'. Use a stronger, more specific verb.")
-            suggestions.append(f"Try: {', '.join(cls.STRONG_VERBS[:5])}")
+            suggestions.append(f"Try: {_STRONG_VERB_HINT}")
             return False
         
         # Check if starts with strong verb
-        if first_word in cls.STRONG_VERBS:
+        if action_lower in _STRONG_VERB_SET or action_lower.startswith(_STRONG_VERB_PREFIXES):
             return True
         
         # Not weak but not in strong list either
@@ -325,12 +506,9 @@ class BulletValidator:
         suggestions: List[str]
     ) -> bool:
         """Check for generic/weak phrases"""
-        text_lower = text.lower()
-        found_generic = []
-        
-        for phrase in cls.GENERIC_PHRASES:
-            if phrase in text_lower:
-                found_generic.append(phrase)
+        # One scan for every phrase, reported in GENERIC_PHRASES order
+        found = _GENERIC_MATCHER.found(text.lower())
+        found_generic = [phrase for phrase in GENERIC_PHRASES if phrase in found] if found else []
         
         if found_generic:
             warnings.append(f"Generic language detected: {', '.join(found_generic)}")
@@ -344,14 +522,22 @@ class BulletValidator:
         cls, 
         result: str, 
         errors: List[str],
-        suggestions: List[str]
+        suggestions: List[str],
+        has_metric: Optional[bool] = None
     ) -> bool:
-        """Ensure the result field specifically contains metrics"""
+        """
+        Ensure the result field specifically contains metrics.
+        
+        ``has_metric`` is an earlier ``_has_any_metric(result)`` outcome to
+        reuse; when omitted the result is scanned here.
+        """
         if not result:
             return False
         
-        metrics = cls._detect_metrics(result)
-        if not metrics.has_metrics:
+        if has_metric is None:
+            has_metric = cls._has_any_metric(result)
+        
+        if not has_metric:
             errors.append("Result field must contain specific metrics or numbers")
             suggestions.append("Add quantified outcome: 'reducing X by Y%', 'increasing Z to N'")
             return False
@@ -389,34 +575,19 @@ class BulletValidator:
         result_has_metrics: bool
     ) -> int:
         """Calculate overall quality score (0-100)"""
-        score = 0
-        
-        # All 6 points present (30 points)
-        if has_all_six:
-            score += 30
-        
-        # Has metrics (25 points)
-        if has_metrics:
-            score += 25
-        
-        # Result specifically has metrics (20 points)
-        if result_has_metrics:
-            score += 20
-        
-        # Character count in range (10 points)
-        if cls.MIN_CHARS <= char_count <= cls.MAX_CHARS:
-            score += 10
-            # Bonus for being close to ideal
-            if abs(char_count - cls.IDEAL_CHARS) <= 5:
-                score += 5
-        
-        # Strong action verb (5 points)
-        if strong_verb:
-            score += 5
+        # Booleans count as 0/1: all 6 points (30), metrics (25), result
+        # metrics (20), strong verb (5) and no generic language (5)
+        score = (
+            30 * has_all_six
+            + 25 * has_metrics
+            + 20 * result_has_metrics
+            + 5 * strong_verb
+            + 5 * no_generic
+        )
         
-        # No generic language (5 points)
-        if no_generic:
-            score += 5
+        # Character count in range (10 points, +5 close to ideal)
+        if MIN_CHARS <= char_count <= MAX_CHARS:
+            score += _CHAR_COUNT_POINTS[char_count - MIN_CHARS]
         
         return min(100, score)
     
@@ -426,41 +597,25 @@ class BulletValidator:
         if not current_action:
             return "Led"
         
-        current_lower = current_action.lower()
-        
-        # Simple mapping of weak to strong
-        suggestions_map = {
-            "helped": "Enabled",
-            "worked on": "Developed",
-            "assisted": "Supported",
-            "responsible for": "Managed",
-            "participated": "Contributed",
-            "handled": "Managed",
-            "did": "Executed",
-            "made": "Created"
-        }
-        
-        for weak, strong in suggestions_map.items():
-            if weak in current_lower:
-                return strong
-        
-        # Default suggestions
-        return "Led"
+        return _strong_verb_for(current_action.lower())
     
     @classmethod
     def auto_fix_bullet(cls, bullet: SixPointBullet) -> Tuple[SixPointBullet, List[str]]:
         """
         Attempt to automatically fix common issues.
         
+        The fixed bullet is a shallow copy: only its string fields are
+        replaced, and list fields such as ``tags`` are shared with ``bullet``.
+        
         Returns:
             Tuple of (fixed_bullet, list_of_changes_made)
         """
         changes = []
-        fixed = bullet.copy(deep=True)
+        fixed = bullet.model_copy()
         
         # Fix 1: Trim if too long
         full_text = cls._assemble_bullet(fixed)
-        if len(full_text) > cls.MAX_CHARS:
+        if len(full_text) > MAX_CHARS:
             # Try trimming outcome first (least critical)
             if len(fixed.outcome) > 20:
                 fixed.outcome = fixed.outcome[:20] + "..."
@@ -468,14 +623,14 @@ class BulletValidator:
             
             # Recalculate
             full_text = cls._assemble_bullet(fixed)
-            if len(full_text) > cls.MAX_CHARS:
+            if len(full_text) > MAX_CHARS:
                 # Trim impact
                 if len(fixed.impact) > 20:
                     fixed.impact = fixed.impact[:20] + "..."
                     changes.append("Trimmed impact to fit character limit")
         
         # Fix 2: Suggest strong verb
-        if fixed.action and fixed.action.lower().split()[0] in cls.WEAK_VERBS:
+        if fixed.action and fixed.action.lower().split()[0] in _WEAK_VERB_SET:
             suggested = cls._suggest_strong_verb(fixed.action)
             original = fixed.action
             # Don't auto-replace, just suggest
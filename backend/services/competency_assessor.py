@@ -5,9 +5,97 @@ Analyzes job descriptions to extract competencies, assign weightage,
 and calculate fit scores for better resume tailoring.
 """
 
+import heapq
 import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Tuple, Optional
 from collections import Counter
+from performance_utils import KeywordMatcher
+
+
+# "Required", "must have" and "essential" sections, compiled once
+_REQUIRED_SECTION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"(?:required|must have|essential)[\s:]+(.+?)(?:\n\n|\Z)",
+        r"(?:minimum qualifications?)[\s:]+(.+?)(?:\n\n|\Z)",
+        r"(?:you|candidate) must[\s:]+(.+?)(?:\n\n|\Z)"
+    )
+)
+_RE_ITEM_SPLIT = re.compile(r'[•\-\*\n]+')
+
+# Word tokens of lowercased text; hyphens, "&" and "+" stay inside a token
+# so "data-driven", "p&l" and "c++" read as one word (no trailing \b, which
+# could not match after a "+")
+_RE_TOKEN = re.compile(r'\b[a-z][a-z0-9+&-]*')
+
+_BY_YOUR_SCORE = attrgetter('your_score')
+_BY_GAP = attrgetter('gap')
+
+
+def _build_keyword_slots(
+    competency_keywords: Dict[str, Tuple[str, ...]]
+) -> Dict[str, Tuple[Tuple[int, int], ...]]:
+    """Map each keyword to its (competency index, position in that competency) slots."""
+    slots: Dict[str, Tuple[Tuple[int, int], ...]] = {}
+    for comp_index, keywords in enumerate(competency_keywords.values()):
+        for position, keyword in enumerate(keywords):
+            slots[keyword] = slots.get(keyword, ()) + ((comp_index, position),)
+    return slots
+
+
+@dataclass(frozen=True, slots=True)
+class TextProfile:
+    """
+    Competency keyword occurrences in one lowercased text.
+    
+    Built by ``CompetencyAssessor._profile`` from a single tokenization and
+    phrase scan, and shared by JD assessment and fit scoring.
+    """
+    counts: Dict[str, int]
+
+
+@dataclass(slots=True)
+class CompetencyHit:
+    """A competency found in a JD, with its keyword score and weightage"""
+    name: str
+    score: int
+    keywords_found: List[str] = field(default_factory=list)
+    weightage: float = 0.0
+    
+    def to_dict(self) -> Dict:
+        """Fresh API dict for this competency"""
+        return {
+            "name": self.name,
+            "score": self.score,
+            "keywords_found": list(self.keywords_found),
+            "keyword_count": len(self.keywords_found),
+            "weightage": self.weightage
+        }
+
+
+@dataclass(slots=True)
+class CompetencyFit:
+    """How well a candidate covers one JD competency"""
+    competency: str
+    weightage: float
+    your_score: int
+    matched_keywords: int
+    total_keywords: int
+    gap: int
+    
+    def to_dict(self) -> Dict:
+        """API dict for this competency fit"""
+        return {
+            "competency": self.competency,
+            "weightage": self.weightage,
+            "your_score": self.your_score,
+            "matched_keywords": self.matched_keywords,
+            "total_keywords": self.total_keywords,
+            "gap": self.gap
+        }
 
 
 class CompetencyAssessor:
@@ -15,65 +103,88 @@ class CompetencyAssessor:
     
     # Pre-defined competency categories with keywords
     COMPETENCY_KEYWORDS = {
-        "Product Strategy": [
+        "Product Strategy": (
             "product vision", "roadmap", "strategy", "prioritization",
             "product-market fit", "pmf", "market analysis", "competitive analysis",
             "go-to-market", "gtm", "positioning", "product launch"
-        ],
+        ),
         
-        "Technical Skills": [
+        "Technical Skills": (
             "engineering", "technical", "architecture", "api", "backend",
             "frontend", "full-stack", "database", "cloud", "aws", "azure",
             "python", "javascript", "react", "node", "sql", "system design"
-        ],
+        ),
         
-        "Data & Analytics": [
+        "Data & Analytics": (
             "analytics", "metrics", "kpis", "data-driven", "ab testing",
             "sql", "tableau", "looker", "experiments", "analysis",
             "reporting", "insights", "business intelligence", "bi"
-        ],
+        ),
         
-        "Stakeholder Management": [
+        "Stakeholder Management": (
             "stakeholder", "cross-functional", "alignment", "executive",
             "communication", "collaboration", "influence", "consensus",
             "presentations", "relationship building"
-        ],
+        ),
         
-        "Leadership & Team": [
+        "Leadership & Team": (
             "lead", "mentor", "coach", "team", "manage", "direct",
             "hire", "hiring", "people management", "leadership",
             "delegation", "motivation", "team building"
-        ],
+        ),
         
-        "User Research & Design": [
+        "User Research & Design": (
             "user research", "ux", "ui", "usability", "user testing",
             "customer interviews", "personas", "journey mapping",
             "design thinking", "wireframes", "prototypes"
-        ],
+        ),
         
-        "Execution & Delivery": [
+        "Execution & Delivery": (
             "execution", "delivery", "agile", "scrum", "sprint",
             "project management", "release", "launch", "ship",
             "implementation", "timelines", "dependencies"
-        ],
+        ),
         
-        "Business Acumen": [
+        "Business Acumen": (
             "revenue", "profit", "roi", "business model", "pricing",
             "market", "customer acquisition", "retention", "growth",
             "business case", "p&l", "budget"
-        ],
+        ),
         
-        "Communication": [
+        "Communication": (
             "communication", "presentation", "documentation", "writing",
             "articulate", "storytelling", "influence", "negotiation",
             "public speaking", "executive communication"
-        ],
+        ),
         
-        "Problem Solving": [
+        "Problem Solving": (
             "problem solving", "analytical", "critical thinking",
             "troubleshooting", "root cause", "creative", "innovative",
             "strategic thinking", "decision making"
-        ]
+        )
+    }
+    
+    # Single-word keywords are counted as token prefixes from a bag of words:
+    # stems still match their inflections ("manage" in "managed", "lead" in
+    # "leading") while "ui" no longer matches inside "building". Phrases keep
+    # a substring scan
+    _SINGLE_WORD_KEYWORDS = frozenset(
+        keyword for keywords in COMPETENCY_KEYWORDS.values() for keyword in keywords
+        if " " not in keyword
+    )
+    _MAX_SINGLE_WORD_LEN = max(map(len, _SINGLE_WORD_KEYWORDS))
+    _PHRASE_MATCHER = KeywordMatcher(
+        keyword for keywords in COMPETENCY_KEYWORDS.values() for keyword in keywords
+        if " " in keyword
+    )
+    # Flat keyword -> competency slot table, so scoring visits only the
+    # keywords found instead of every keyword of every competency
+    _COMPETENCY_NAMES = tuple(COMPETENCY_KEYWORDS)
+    _KEYWORD_SLOTS = _build_keyword_slots(COMPETENCY_KEYWORDS)
+    # Per-competency keyword sets, so fit matching is one set intersection
+    _KEYWORD_SETS = {
+        competency: frozenset(keywords)
+        for competency, keywords in COMPETENCY_KEYWORDS.items()
     }
     
     # Company stage indicators
@@ -91,6 +202,10 @@ class CompetencyAssessor:
             "established", "1000+ employees", "mature", "public company"
         ]
     }
+    # All stage indicators in one matcher for a single pass over the JD
+    _STAGE_MATCHER = KeywordMatcher(
+        indicator for indicators in STAGE_INDICATORS.values() for indicator in indicators
+    )
     
     @classmethod
     def assess_job_description(
@@ -108,23 +223,64 @@ class CompetencyAssessor:
             skills: List of required skills (optional)
             
         Returns:
-            Dict with competencies, weightage, stage, and recommendations
+            Dict with competencies, weightage, stage, and recommendations.
+            Assessments are memoized per input; each call gets its own copy,
+            so callers may add keys or edit the lists.
         """
-        # Combine all text
-        full_text = jd_text.lower()
+        assessment = cls._assess_cached(
+            jd_text,
+            tuple(requirements) if requirements else (),
+            tuple(skills) if skills else ()
+        )
+        return {
+            **assessment,
+            "competencies": [comp.to_dict() for comp in assessment["competencies"]],
+            "key_requirements": list(assessment["key_requirements"]),
+            "recommendations": list(assessment["recommendations"])
+        }
+    
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop memoized JD assessments, e.g. after editing the keyword tables."""
+        cls._assess_cached.cache_clear()
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _assess_cached(
+        jd_text: str,
+        requirements: Tuple[str, ...],
+        skills: Tuple[str, ...]
+    ) -> Dict:
+        return CompetencyAssessor._assess(jd_text, requirements, skills)
+    
+    @classmethod
+    def _assess(
+        cls,
+        jd_text: str,
+        requirements: Tuple[str, ...],
+        skills: Tuple[str, ...]
+    ) -> Dict:
+        """
+        Run the full assessment. Competencies are kept as CompetencyHit
+        objects; the result is cached and must not be mutated.
+        """
+        # Combine all text, lowercasing it in a single pass; the space
+        # separator keeps words from adjacent pieces from running together
+        pieces = [jd_text]
         if requirements:
-            full_text += " ".join(requirements).lower()
+            pieces.append(" ".join(requirements))
         if skills:
-            full_text += " ".join(skills).lower()
+            pieces.append(" ".join(skills))
+        full_text = " ".join(pieces).lower()
         
         # Extract competencies with scores
         competencies = cls._extract_competencies(full_text)
         
         # Calculate weightage (percentage distribution)
-        total_score = sum(c["score"] for c in competencies)
+        total_score = sum(c.score for c in competencies)
         if total_score > 0:
             for comp in competencies:
-                comp["weightage"] = round((comp["score"] / total_score) * 100, 1)
+                comp.weightage = round((comp.score / total_score) * 100, 1)
         
         # Detect company stage
         stage = cls._detect_company_stage(full_text)
@@ -161,18 +317,21 @@ class CompetencyAssessor:
         Returns:
             Dict with fit scores per competency and overall
         """
-        user_text = " ".join(user_skills).lower()
-        user_text += " ".join([
-            f"{exp.get('role', '')} {exp.get('description', '')}"
-            for exp in user_experience
+        user_text = " ".join([
+            *user_skills,
+            *(f"{exp.get('role', '')} {exp.get('description', '')}" for exp in user_experience)
         ]).lower()
         
         competency_scores = []
         
+        # Every competency keyword in the user's text, matched the same way
+        # as the JD. Not cached: resume text must not outlive the request.
+        found = cls._profile(user_text).counts
+        
         for comp in jd_assessment["competencies"]:
             # Count matching keywords
-            keywords = cls.COMPETENCY_KEYWORDS.get(comp["name"], [])
-            matches = sum(1 for kw in keywords if kw in user_text)
+            keywords = cls._KEYWORD_SETS.get(comp["name"], frozenset())
+            matches = len(keywords.intersection(found))
             total_keywords = len(keywords)
             
             if total_keywords > 0:
@@ -180,63 +339,85 @@ class CompetencyAssessor:
             else:
                 score = 0
             
-            competency_scores.append({
-                "competency": comp["name"],
-                "weightage": comp["weightage"],
-                "your_score": score,
-                "matched_keywords": matches,
-                "total_keywords": total_keywords,
-                "gap": max(0, 100 - score)
-            })
+            competency_scores.append(CompetencyFit(
+                competency=comp["name"],
+                weightage=comp["weightage"],
+                your_score=score,
+                matched_keywords=matches,
+                total_keywords=total_keywords,
+                gap=max(0, 100 - score)
+            ))
         
         # Calculate weighted overall fit
         if competency_scores:
             overall_fit = sum(
-                cs["your_score"] * (cs["weightage"] / 100)
+                cs.your_score * (cs.weightage / 100)
                 for cs in competency_scores
             )
         else:
             overall_fit = 0
         
+        # Convert at the API boundary; the top lists share the same dicts
+        fit_dicts = {id(cs): cs.to_dict() for cs in competency_scores}
+        top_strengths = heapq.nlargest(3, competency_scores, key=_BY_YOUR_SCORE)
+        top_gaps = heapq.nlargest(3, competency_scores, key=_BY_GAP)
+        
         return {
             "overall_fit": int(overall_fit),
-            "competency_scores": competency_scores,
-            "top_strengths": sorted(competency_scores, key=lambda x: x["your_score"], reverse=True)[:3],
-            "top_gaps": sorted(competency_scores, key=lambda x: x["gap"], reverse=True)[:3]
+            "competency_scores": [fit_dicts[id(cs)] for cs in competency_scores],
+            "top_strengths": [fit_dicts[id(cs)] for cs in top_strengths],
+            "top_gaps": [fit_dicts[id(cs)] for cs in top_gaps]
         }
     
+    @staticmethod
+    def _profile(text: str) -> TextProfile:
+        """
+        Count every competency keyword in lowercased text: phrases from one
+        matcher scan, single words as token prefixes from one tokenization.
+        """
+        counts = CompetencyAssessor._PHRASE_MATCHER.counts(text)
+        keywords = CompetencyAssessor._SINGLE_WORD_KEYWORDS
+        max_len = CompetencyAssessor._MAX_SINGLE_WORD_LEN
+        for token, count in Counter(_RE_TOKEN.findall(text)).items():
+            # Every keyword the token starts with ("leadership" counts both
+            # "lead" and "leadership")
+            for end in range(1, min(len(token), max_len) + 1):
+                prefix = token[:end]
+                if prefix in keywords:
+                    counts[prefix] = counts.get(prefix, 0) + count
+        return TextProfile(counts=counts)
+    
     @classmethod
-    def _extract_competencies(cls, text: str) -> List[Dict]:
+    def _extract_competencies(cls, text: str) -> List[CompetencyHit]:
         """Extract competencies from text with scoring"""
-        competency_scores = {}
-        
-        for competency, keywords in cls.COMPETENCY_KEYWORDS.items():
-            score = 0
-            found_keywords = []
-            
-            for keyword in keywords:
-                # Count occurrences
-                count = text.count(keyword)
-                if count > 0:
-                    score += count
-                    found_keywords.append(keyword)
+        counts = cls._profile(text).counts
+        if not counts:
+            return []
+        
+        # Bucket the found keywords by competency, keeping keyword positions
+        # so keywords_found stays in declaration order
+        slots = cls._KEYWORD_SLOTS
+        buckets: Dict[int, List[Tuple[int, str]]] = {}
+        for keyword in counts:
+            for comp_index, position in slots[keyword]:
+                buckets.setdefault(comp_index, []).append((position, keyword))
+        
+        competency_hits = []
+        for comp_index in sorted(buckets):
+            found_keywords = [keyword for _, keyword in sorted(buckets[comp_index])]
+            score = sum(counts[keyword] for keyword in found_keywords)
             
             if score > 0:
-                competency_scores[competency] = {
-                    "name": competency,
-                    "score": score,
-                    "keywords_found": found_keywords,
-                    "keyword_count": len(found_keywords)
-                }
+                competency_hits.append(CompetencyHit(
+                    name=cls._COMPETENCY_NAMES[comp_index],
+                    score=score,
+                    keywords_found=found_keywords
+                ))
         
         # Sort by score
-        sorted_competencies = sorted(
-            competency_scores.values(),
-            key=lambda x: x["score"],
-            reverse=True
-        )
+        competency_hits.sort(key=lambda x: x.score, reverse=True)
         
-        return sorted_competencies
+        return competency_hits
     
     @classmethod
     def _detect_company_stage(cls, text: str) -> str:
@@ -247,10 +428,11 @@ class CompetencyAssessor:
             "enterprise": 0
         }
         
-        for stage, indicators in cls.STAGE_INDICATORS.items():
-            for indicator in indicators:
-                if indicator in text:
-                    stage_scores[stage] += 1
+        # One scan finds every indicator present; each counts once per stage
+        found = cls._STAGE_MATCHER.found(text)
+        if found:
+            for stage, indicators in cls.STAGE_INDICATORS.items():
+                stage_scores[stage] = sum(1 for indicator in indicators if indicator in found)
         
         # Return stage with highest score
         if max(stage_scores.values()) == 0:
@@ -263,29 +445,26 @@ class CompetencyAssessor:
         """Extract key must-have requirements"""
         requirements = []
         
-        # Look for "required", "must have", "essential" sections
-        required_patterns = [
-            r"(?:required|must have|essential)[\s:]+(.+?)(?:\n\n|\Z)",
-            r"(?:minimum qualifications?)[\s:]+(.+?)(?:\n\n|\Z)",
-            r"(?:you|candidate) must[\s:]+(.+?)(?:\n\n|\Z)"
-        ]
-        
-        for pattern in required_patterns:
-            matches = re.findall(pattern, jd_text, re.IGNORECASE | re.DOTALL)
-            for match in matches:
+        # Look for "required", "must have", "essential" sections. Sections
+        # matched by different patterns may overlap, so each pattern keeps
+        # its own scan; stop scanning once the top 10 are collected.
+        for pattern in _REQUIRED_SECTION_PATTERNS:
+            for match in pattern.finditer(jd_text):
                 # Split by bullet points or newlines
-                items = re.split(r'[•\-\*\n]+', match)
+                items = _RE_ITEM_SPLIT.split(match.group(1))
                 for item in items:
                     cleaned = item.strip()
                     if len(cleaned) > 10 and len(cleaned) < 200:
                         requirements.append(cleaned)
+                        if len(requirements) == 10:
+                            return requirements
         
-        return requirements[:10]  # Limit to top 10
+        return requirements  # At most the top 10
     
     @classmethod
     def _generate_recommendations(
         cls,
-        competencies: List[Dict],
+        competencies: List[CompetencyHit],
         stage: str
     ) -> List[str]:
         """Generate tailored recommendations based on assessment"""
@@ -297,7 +476,7 @@ class CompetencyAssessor:
         # Top competency recommendation
         top_comp = competencies[0]
         recommendations.append(
-            f"Emphasize {top_comp['name']} - it's heavily weighted in this role"
+            f"Emphasize {top_comp.name} - it's heavily weighted in this role"
         )
         
         # Stage-specific recommendations
@@ -333,7 +512,7 @@ class CompetencyAssessor:
         if competencies:
             top_keywords = []
             for comp in competencies[:3]:
-                top_keywords.extend(comp["keywords_found"][:2])
+                top_keywords.extend(comp.keywords_found[:2])
             recommendations.append(
                 f"Include these keywords: {', '.join(top_keywords[:5])}"
             )
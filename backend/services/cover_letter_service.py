@@ -4,11 +4,18 @@ Based on Aakash Gupta's methodology used in Apply-Pilot.
 """
 
 import logging
+import re
 from typing import Dict, Any, List, Optional
 from services.ai_service import AIService
 
 logger = logging.getLogger(__name__)
 
+# Leading lines that open with a common AI preamble, matched as one run
+_RE_AI_PREFIX_LINES = re.compile(
+    r'\A(?:[^\S\n]*(?:Here is a cover letter|Sure, here is|Cover letter:|Subject:)[^\n]*(?:\n|\Z))+'
+)
+_RE_MARKDOWN_FENCE = re.compile(r'```(?:markdown)?')
+
 class CoverLetterService:
     """Creates company-specific cover letters using the 4-paragraph framework."""
     
@@ -110,13 +117,9 @@ class CoverLetterService:
     def _clean_content(cls, content: str) -> str:
         """Remove AI prefixes or suffixes."""
         # Remove common AI prefixes
-        prefixes = ["Here is a cover letter", "Sure, here is", "Cover letter:", "Subject:"]
-        lines = content.strip().split('\n')
-        while lines and any(lines[0].strip().startswith(p) for p in prefixes):
-            lines.pop(0)
-            
+        content = _RE_AI_PREFIX_LINES.sub('', content.strip(), count=1)
+        
         # Remove markdown markers if any
-        content = "\n".join(lines).strip()
-        content = content.replace("```markdown", "").replace("```", "").strip()
+        content = _RE_MARKDOWN_FENCE.sub('', content.strip())
         
-        return content
+        return content.strip()
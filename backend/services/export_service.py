@@ -2,7 +2,8 @@
 import logging
 import os
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 from docx import Document
 from fpdf import FPDF
 from schemas import ResumeData
@@ -10,6 +11,37 @@ from slugify import slugify
 
 logger = logging.getLogger(__name__)
 
+# LaTeX special characters and their escapes, applied in a single pass
+_LATEX_ESCAPES = str.maketrans({
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '^': r'\textasciicircum{}',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '\\': r'\textbackslash{}',
+})
+
+
+def _escape_latex(text: str) -> str:
+    """Escape LaTeX special characters."""
+    if not text:
+        return ""
+    return text.translate(_LATEX_ESCAPES)
+
+
+# Export directories this process has already created
+_created_dirs: Set[str] = set()
+
+
+@lru_cache(maxsize=128)
+def _slug(job_title: str) -> str:
+    """Memoized slugify, reused when one job is exported to several formats."""
+    return slugify(job_title)
+
 
 class ExportService:
     """Service for exporting resumes to various formats."""
@@ -19,9 +51,11 @@ class ExportService:
         """Creates an organized path: storage/exports/YYYY-MM-DD/job-title/"""
         try:
             date_str = datetime.now().strftime("%Y-%m-%d")
-            slug_title = slugify(job_title or "general")
+            slug_title = _slug(job_title or "general")
             path = os.path.join(base_dir, date_str, slug_title)
-            os.makedirs(path, exist_ok=True)
+            if path not in _created_dirs:
+                os.makedirs(path, exist_ok=True)
+                _created_dirs.add(path)
             return path
         except Exception as e:
             logger.error(f"Failed to create organized path: {str(e)}")
@@ -35,7 +69,15 @@ class ExportService:
                 raise ValueError("Resume name is required")
             
             doc = Document()
-            doc.add_heading(resume.name, 0)
+            
+            # Resolve heading styles once; add_heading would look the style
+            # up by name for every heading
+            styles = doc.styles
+            title_style = styles['Title']
+            section_style = styles['Heading 1']
+            entry_style = styles['Heading 2']
+            
+            doc.add_paragraph(resume.name, style=title_style)
             
             # Contact information
             contact_parts = [resume.email]
@@ -50,16 +92,16 @@ class ExportService:
             
             # Summary
             if resume.summary:
-                doc.add_heading('Summary', level=1)
+                doc.add_paragraph('Summary', style=section_style)
                 doc.add_paragraph(resume.summary)
             
             # Experience
             if resume.experience:
-                doc.add_heading('Experience', level=1)
+                doc.add_paragraph('Experience', style=section_style)
                 for exp in resume.experience:
                     role = exp.get('role', 'N/A')
                     company = exp.get('company', 'N/A')
-                    doc.add_heading(f"{role} at {company}", level=2)
+                    doc.add_paragraph(f"{role} at {company}", style=entry_style)
                     
                     if exp.get('duration'):
                         doc.add_paragraph(exp['duration']).italic = True
@@ -69,10 +111,10 @@ class ExportService:
             
             # Education
             if resume.education:
-                doc.add_heading('Education', level=1)
+                doc.add_paragraph('Education', style=section_style)
                 for edu in resume.education:
                     institution = edu.get('institution', 'N/A')
-                    doc.add_heading(institution, level=2)
+                    doc.add_paragraph(institution, style=entry_style)
                     
                     degree = edu.get('degree', '')
                     year = edu.get('graduation_year', '')
@@ -83,7 +125,7 @@ class ExportService:
             
             # Skills
             if resume.skills:
-                doc.add_heading('Skills', level=1)
+                doc.add_paragraph('Skills', style=section_style)
                 doc.add_paragraph(", ".join(resume.skills))
             
             # Ensure directory exists
@@ -187,89 +229,81 @@ class ExportService:
             if not resume.name:
                 raise ValueError("Resume name is required")
             
-            # Escape LaTeX special characters
+            # Per-call memo: companies and skills repeat within one resume,
+            # but personal details must not outlive the export
+            escaped: Dict[str, str] = {}
+
             def escape_latex(text: str) -> str:
-                if not text:
-                    return ""
-                replacements = {
-                    '&': r'\&',
-                    '%': r'\%',
-                    '$': r'\$',
-                    '#': r'\#',
-                    '^': r'\textasciicircum{}',
-                    '_': r'\_',
-                    '{': r'\{',
-                    '}': r'\}',
-                    '~': r'\textasciitilde{}',
-                    '\\': r'\textbackslash{}',
-                }
-                for char, replacement in replacements.items():
-                    text = text.replace(char, replacement)
-                return text
+                result = escaped.get(text)
+                if result is None:
+                    result = escaped[text] = _escape_latex(text)
+                return result
             
             name_parts = resume.name.split()
             first_name = escape_latex(name_parts[0]) if name_parts else ""
             last_name = escape_latex(" ".join(name_parts[1:])) if len(name_parts) > 1 else ""
             
-            latex = r"""
+            # Collect fragments and join once rather than growing a string
+            parts: List[str] = [
+                r"""
 \documentclass[11pt,a4paper,sans]{moderncv}
 \moderncvstyle{casual}
 \moderncvcolor{blue}
-\name{""" + first_name + "}{" + last_name + r"""}
-\address{""" + escape_latex(resume.email) + r"""}
+\name{""", first_name, "}{", last_name, r"""}
+\address{""", escape_latex(resume.email), r"""}
 """
+            ]
             
             if resume.phone:
-                latex += r"\phone[mobile]{" + escape_latex(resume.phone) + r"}\n"
+                parts.extend((r"\phone[mobile]{", escape_latex(resume.phone), r"}\n"))
             
             if resume.linkedin:
-                latex += r"\social[linkedin]{" + escape_latex(resume.linkedin) + r"}\n"
+                parts.extend((r"\social[linkedin]{", escape_latex(resume.linkedin), r"}\n"))
             
-            latex += r"""
+            parts.append(r"""
 \begin{document}
 \makecvtitle
 
-"""
+""")
             
             # Summary
             if resume.summary:
-                latex += r"\section{Summary}" + "\n"
-                latex += escape_latex(resume.summary) + "\n\n"
+                parts.extend((r"\section{Summary}" + "\n", escape_latex(resume.summary), "\n\n"))
             
             # Experience
             if resume.experience:
-                latex += r"\section{Experience}" + "\n"
+                parts.append(r"\section{Experience}" + "\n")
                 for exp in resume.experience:
                     duration = escape_latex(exp.get('duration', ''))
                     role = escape_latex(exp.get('role', ''))
                     company = escape_latex(exp.get('company', ''))
                     description = escape_latex(exp.get('description', ''))
-                    latex += f"\\cventry{{{duration}}}{{{role}}}{{{company}}}{{}}{{}}{{{description}}}\n"
-                latex += "\n"
+                    parts.append(f"\\cventry{{{duration}}}{{{role}}}{{{company}}}{{}}{{}}{{{description}}}\n")
+                parts.append("\n")
             
             # Education
             if resume.education:
-                latex += r"\section{Education}" + "\n"
+                parts.append(r"\section{Education}" + "\n")
                 for edu in resume.education:
                     year = escape_latex(str(edu.get('graduation_year', '')))
                     degree = escape_latex(edu.get('degree', ''))
                     institution = escape_latex(edu.get('institution', ''))
-                    latex += f"\\cventry{{{year}}}{{{degree}}}{{{institution}}}{{}}{{}}{{}}\n"
-                latex += "\n"
+                    parts.append(f"\\cventry{{{year}}}{{{degree}}}{{{institution}}}{{}}{{}}{{}}\n")
+                parts.append("\n")
             
             # Skills
             if resume.skills:
-                latex += r"\section{Skills}" + "\n"
-                skills_text = ", ".join([escape_latex(skill) for skill in resume.skills])
-                latex += f"\\cvitem{{Core Skills}}{{{skills_text}}}\n\n"
+                parts.append(r"\section{Skills}" + "\n")
+                skills_text = ", ".join(map(escape_latex, resume.skills))
+                parts.append(f"\\cvitem{{Core Skills}}{{{skills_text}}}\n\n")
             
-            latex += r"""
+            parts.append(r"""
 \end{document}
-"""
+""")
+            latex = "".join(parts)
             
             logger.info("Successfully generated LaTeX export")
             return latex
         except Exception as e:
             logger.error(f"Failed to export LaTeX: {str(e)}", exc_info=True)
             raise
-
@@ -4,13 +4,39 @@ Inspired by Apply-Pilot's JD Assessor agent.
 """
 
 import re
+import copy
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from itertools import chain
+from typing import AbstractSet, Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+from performance_utils import KeywordMatcher, canonical_json, get_keyword_matcher
+
 logger = logging.getLogger(__name__)
 
+# Most recent assessments keyed by a digest of their inputs, oldest first
+_ASSESSMENT_CACHE_SIZE = 256
+_assessment_cache: "OrderedDict[bytes, JDAssessment]" = OrderedDict()
+
+
+def _assessment_key(
+    jd_lower: str,
+    resume_data: Dict[str, Any],
+    custom_competencies: Optional[Dict]
+) -> Optional[bytes]:
+    """Content digest of assess() inputs, or None when they cannot be serialized."""
+    try:
+        payload = canonical_json([resume_data, custom_competencies])
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.blake2b(jd_lower.encode(), digest_size=16)
+    digest.update(b"|")
+    digest.update(payload)
+    return digest.digest()
+
 
 class FitLevel(Enum):
     EXCELLENT = "excellent"  # 85-100%
@@ -129,32 +155,71 @@ class JDAssessor:
         }
     }
 
+    # Common high-interest signals used for the interest level
+    HIGH_INTEREST_KEYWORDS = ["remote", "leadership", "0-to-1", "founding", "growth"]
+
+    # (keyword, lowercased keyword) pairs per default area, built once
+    _AREA_KEYWORD_PAIRS = {
+        area: tuple((kw, kw.lower()) for kw in config["keywords"])
+        for area, config in COMPETENCY_AREAS.items()
+    }
+
+    # Keyword sets for the signals that only need presence counts
+    _DOMAIN_KEYWORD_SETS = {
+        domain: frozenset(keywords)
+        for domain, keywords in SKILLS_INTELLIGENCE["domains"].items()
+    }
+    _ARCHETYPE_PATTERN_SETS = {
+        archetype: frozenset(patterns)
+        for archetype, patterns in ARCHETYPE_PATTERNS.items()
+    }
+    _HIGH_INTEREST_SET = frozenset(HIGH_INTEREST_KEYWORDS)
+
+    # Every keyword the JD is checked for, so a JD is scanned once per assessment
+    _JD_MATCHER = KeywordMatcher(chain(
+        (kw for area in COMPETENCY_AREAS.values() for kw in area["keywords"]),
+        (kw for patterns in ARCHETYPE_PATTERNS.values() for kw in patterns),
+        SKILLS_INTELLIGENCE["tier_1"],
+        SKILLS_INTELLIGENCE["tier_2"],
+        (alt for alts in SKILLS_INTELLIGENCE["tier_2"].values() for alt in alts),
+        (kw for kws in SKILLS_INTELLIGENCE["domains"].values() for kw in kws),
+        HIGH_INTEREST_KEYWORDS,
+    ))
+
     @classmethod
-    def analyze_skills_intelligence(cls, job_description: str) -> Dict[str, Any]:
+    def analyze_skills_intelligence(
+        cls,
+        job_description: str,
+        jd_hits: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, Any]:
         """
         Analyze JD to determine which Tier 1/2 skills should be prioritized.
         Based on Apply-Pilot's Skills Section Intelligence Framework.
+        
+        ``jd_hits`` are the keywords already found in the lowercased JD; pass
+        them when precomputed.
         """
-        jd_lower = job_description.lower()
+        if jd_hits is None:
+            jd_hits = cls._JD_MATCHER.found(job_description.lower())
         
-        prioritized_tier_1 = [s for s in cls.SKILLS_INTELLIGENCE["tier_1"] if s in jd_lower]
+        prioritized_tier_1 = [s for s in cls.SKILLS_INTELLIGENCE["tier_1"] if s in jd_hits]
         
         # Determine swaps for Tier 2 tools
         swaps = {}
         for primary, alternatives in cls.SKILLS_INTELLIGENCE["tier_2"].items():
-            if primary in jd_lower:
+            if primary in jd_hits:
                 swaps[primary] = primary
             else:
                 for alt in alternatives:
-                    if alt in jd_lower:
+                    if alt in jd_hits:
                         swaps[primary] = alt
                         break
         
         # Detect domain-heavy JDs
-        detected_domains = []
-        for domain, keywords in cls.SKILLS_INTELLIGENCE["domains"].items():
-            if any(k in jd_lower for k in keywords):
-                detected_domains.append(domain)
+        detected_domains = [
+            domain for domain, keywords in cls._DOMAIN_KEYWORD_SETS.items()
+            if not keywords.isdisjoint(jd_hits)
+        ]
         
         return {
             "prioritized_tier_1": prioritized_tier_1,
@@ -176,13 +241,55 @@ class JDAssessor:
     ) -> JDAssessment:
         """
         Assess candidate fit against job description.
+        
+        Assessments are memoized by input content. Each call gets its own
+        copy, so callers may modify the result.
         """
         jd_lower = job_description.lower()
+        key = _assessment_key(jd_lower, resume_data, custom_competencies)
+        if key is not None:
+            cached = _assessment_cache.get(key)
+            if cached is not None:
+                _assessment_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+        
+        assessment = cls._assess(jd_lower, resume_data, custom_competencies)
+        
+        if key is not None:
+            _assessment_cache[key] = copy.deepcopy(assessment)
+            if len(_assessment_cache) > _ASSESSMENT_CACHE_SIZE:
+                _assessment_cache.popitem(last=False)
+        return assessment
+    
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop memoized assessments, e.g. after editing the keyword tables."""
+        _assessment_cache.clear()
+    
+    @classmethod
+    def _assess(
+        cls,
+        jd_lower: str,
+        resume_data: Dict[str, Any],
+        custom_competencies: Optional[Dict]
+    ) -> JDAssessment:
+        """Run the full assessment on the lowercased JD."""
         competencies = custom_competencies or cls.COMPETENCY_AREAS
         
-        # Extract candidate skills and experience
+        # Scan the JD once for every keyword the assessment checks
+        matcher = cls._JD_MATCHER
+        if competencies is not cls.COMPETENCY_AREAS:
+            matcher = get_keyword_matcher(matcher.keywords + tuple(
+                kw for config in competencies.values() for kw in config.get("keywords", [])
+            ))
+        jd_hits = matcher.found(jd_lower)
+        
+        # Extract candidate skills and experience, built and scanned once
+        # for all competency areas
         candidate_skills = cls._extract_candidate_skills(resume_data)
         candidate_experience = cls._extract_experience_text(resume_data)
+        candidate_text = " ".join(candidate_skills) + " " + candidate_experience
+        candidate_hits = matcher.found(candidate_text)
         
         # Assess each competency area
         competency_matches = []
@@ -190,8 +297,7 @@ class JDAssessor:
         
         for area_name, area_config in competencies.items():
             match = cls._assess_competency(
-                area_name, area_config, jd_lower,
-                candidate_skills, candidate_experience
+                area_name, area_config, jd_hits, candidate_hits
             )
             competency_matches.append(match)
             weighted_score += match.match_score * match.weight
@@ -205,7 +311,7 @@ class JDAssessor:
         gaps = [m.name.replace("_", " ").title() for m in competency_matches if m.match_score < 50]
         
         # Determine spinning recommendation
-        spinning_rec = cls._get_spinning_recommendation(jd_lower)
+        spinning_rec = cls._get_spinning_recommendation(jd_hits)
         
         # Generate action items
         action_items = cls._generate_action_items(competency_matches, gaps)
@@ -214,7 +320,7 @@ class JDAssessor:
         distribution = cls._calculate_bullet_distribution(competency_matches)
         
         # skills intelligence analysis
-        skills_intel = cls.analyze_skills_intelligence(jd_lower)
+        skills_intel = cls.analyze_skills_intelligence(jd_lower, jd_hits)
         
         # summary guidance (Apply-Pilot 360-380 chars rule)
         summary_guidance = (
@@ -223,7 +329,7 @@ class JDAssessor:
         )
         
         # Interest Level and Decision (Apply-Pilot Logic)
-        interest_level = cls._calculate_interest_level(jd_lower, resume_data)
+        interest_level = cls._calculate_interest_level(jd_hits, resume_data)
         decision = cls._determine_decision(fit_score, interest_level)
         
         return JDAssessment(
@@ -274,16 +380,25 @@ class JDAssessor:
         cls,
         area_name: str,
         area_config: Dict,
-        jd_lower: str,
-        candidate_skills: List[str],
-        candidate_experience: str
+        jd_hits: AbstractSet[str],
+        candidate_hits: AbstractSet[str]
     ) -> CompetencyMatch:
-        """Assess a single competency area."""
+        """
+        Assess a single competency area from the keywords found in the
+        lowercased JD and candidate text.
+        """
         keywords = area_config.get("keywords", [])
         weight = area_config.get("weight", 0.2)
         
-        # Find JD mentions
-        jd_mentioned = [kw for kw in keywords if kw.lower() in jd_lower]
+        # Find JD mentions, lowercasing each keyword once for both checks
+        # (precomputed for the default areas). Keywords are stems ("lead",
+        # "manage") matched as substrings, so they are not reduced to
+        # whole-token lookups.
+        if area_config is cls.COMPETENCY_AREAS.get(area_name):
+            keyword_pairs = cls._AREA_KEYWORD_PAIRS[area_name]
+        else:
+            keyword_pairs = [(kw, kw.lower()) for kw in keywords]
+        jd_mentioned = [pair for pair in keyword_pairs if pair[1] in jd_hits]
         
         if not jd_mentioned:
             # Competency not required by JD
@@ -297,9 +412,10 @@ class JDAssessor:
         adjusted_weight = weight * (len(jd_mentioned) / len(keywords))
         
         # Check candidate match
-        candidate_text = " ".join(candidate_skills) + " " + candidate_experience
-        matched = [kw for kw in jd_mentioned if kw.lower() in candidate_text]
-        missing = [kw for kw in jd_mentioned if kw.lower() not in candidate_text]
+        matched = []
+        missing = []
+        for kw, kw_lower in jd_mentioned:
+            (matched if kw_lower in candidate_hits else missing).append(kw)
         
         match_score = (len(matched) / len(jd_mentioned)) * 100 if jd_mentioned else 100
         
@@ -332,14 +448,12 @@ class JDAssessor:
             return FitLevel.WEAK
     
     @classmethod
-    def _get_spinning_recommendation(cls, jd_lower: str) -> str:
+    def _get_spinning_recommendation(cls, jd_hits: AbstractSet[str]) -> str:
         """Determine spinning strategy based on company archetype."""
-        scores = {arch: 0 for arch in cls.ARCHETYPE_PATTERNS}
-        
-        for archetype, patterns in cls.ARCHETYPE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in jd_lower:
-                    scores[archetype] += 1
+        scores = {
+            archetype: len(patterns.intersection(jd_hits))
+            for archetype, patterns in cls._ARCHETYPE_PATTERN_SETS.items()
+        }
         
         top_archetype = max(scores, key=scores.get)
         
@@ -393,22 +507,26 @@ class JDAssessor:
         # Normalize weights
         total_weight = sum(m.weight for m in weighted)
         distribution = {}
+        # Track the first area with the most bullets while allocating
+        top_area = None
+        top_bullets = 0
         
         for match in weighted:
             bullets = int((match.weight / total_weight) * total_bullets)
             if bullets > 0:
                 distribution[match.name] = bullets
+                if bullets > top_bullets:
+                    top_area, top_bullets = match.name, bullets
         
         # Distribute remaining bullets
         remaining = total_bullets - sum(distribution.values())
-        if remaining > 0 and distribution:
-            top_area = max(distribution.keys(), key=lambda k: distribution[k])
+        if remaining > 0 and top_area is not None:
             distribution[top_area] += remaining
         
         return distribution
 
     @classmethod
-    def _calculate_interest_level(cls, jd_lower: str, resume_data: Dict[str, Any]) -> int:
+    def _calculate_interest_level(cls, jd_hits: AbstractSet[str], resume_data: Dict[str, Any]) -> int:
         """
         Assess interest level (1-10) based on JD keywords and candidate preferences.
         """
@@ -416,11 +534,8 @@ class JDAssessor:
         
         # Boost for preferred archetypes/keywords if we had them in resume_data
         # For now, we simulate based on common high-interest signals
-        high_interest_keywords = ["remote", "leadership", "0-to-1", "founding", "growth"]
-        for kw in high_interest_keywords:
-            if kw in jd_lower:
-                interest += 1
-                
+        interest += len(cls._HIGH_INTEREST_SET.intersection(jd_hits))
+        
         # Cap at 10
         return min(10, interest)
 
@@ -1,3 +1,4 @@
+import asyncio
 import trafilatura
 import httpx
 import re
@@ -7,6 +8,13 @@ from typing import Optional, List
 from urllib.parse import urlparse
 from schemas import JobDescription
 from services.ai_service import AIService
+from performance_utils import json_loads
+
+try:
+    import h2  # noqa: F401  Optional: lets the shared client negotiate HTTP/2
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 # Allowed domains for job extraction (SSRF protection)
 ALLOWED_DOMAINS = frozenset([
@@ -31,6 +39,166 @@ ALLOWED_DOMAINS = frozenset([
     "airbnb.com", "stripe.com", "coinbase.com", "dropbox.com", "spotify.com"
 ])
 
+_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; JobHelper/1.0)",
+    "Accept": "text/html",
+}
+
+# Page bodies are read up to this size; extraction keeps far less text
+_MAX_PAGE_BYTES = 2_000_000
+_PAGE_CHUNK_BYTES = 65536
+
+# Pooled client shared by page fetches, so repeat hosts reuse connections
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared fetch client, creating it for the running event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    client = _http_client
+    if client is None or client.is_closed or _http_client_loop is not loop:
+        stale = client
+        # Redirects stay disabled: every fetched URL must pass the allowlist
+        client = _http_client = httpx.AsyncClient(
+            http2=_HTTP2,
+            follow_redirects=False,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            headers=_FETCH_HEADERS,
+        )
+        _http_client_loop = loop
+        # A client from a previous event loop still pools connections bound
+        # to that loop; close it once the replacement is installed
+        if stale is not None and not stale.is_closed:
+            await _close_client(stale)
+    return client
+
+
+async def _close_client(client: httpx.AsyncClient) -> None:
+    """Close a fetch client whose connections may belong to a closed event loop."""
+    try:
+        await client.aclose()
+    except RuntimeError:
+        # "Event loop is closed": the connections cannot be shut down
+        # cleanly, and their sockets are freed once the client is collected
+        pass
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared fetch client, e.g. on application shutdown.
+    
+    Under the serverless entry point (Mangum with lifespan="off") shutdown
+    hooks never fire, so the pool lives until the instance is recycled;
+    a client left on a previous event loop is closed by _get_http_client.
+    """
+    global _http_client
+    if _http_client is not None:
+        client, _http_client = _http_client, None
+        await _close_client(client)
+
+
+# Patterns run on every fetched page, compiled once at import
+_RE_TITLE_LOCATION = re.compile(r'in\s+([A-Z][a-zA-Z\s]+,?\s*(?:United States|[A-Z]{2})?)')
+_RE_SHOW_MORE_CLASS = re.compile(r'show-more-less-html')
+_RE_DESCRIPTION_CLASS = re.compile(r'description')
+_RE_SALARY_RANGE = re.compile(r'\$[\d,]+\s*[-–]\s*\$[\d,]+(?:\s*(?:per\s+)?(?:year|yr|annually))?', re.I)
+_HTML_SALARY_PATTERNS = tuple(re.compile(pattern, re.I) for pattern in (
+    r'baseSalary["\']?\s*[:=]\s*["\']?\$?([\d,]+)',
+    r'salary["\']?\s*[:=]\s*["\']?\$?([\d,]+)',
+))
+_RE_HYBRID = re.compile(r'\bHybrid\b', re.I)
+_RE_REMOTE = re.compile(r'\bRemote\b', re.I)
+_HTML_BENEFIT_PATTERNS = tuple((re.compile(pattern, re.I), name) for pattern, name in (
+    (r'401\(?k\)?', '401(k)'),
+    (r'vision\s+insurance', 'Vision Insurance'),
+    (r'disability\s+insurance', 'Disability Insurance'),
+    (r'health\s+insurance', 'Health Insurance'),
+    (r'dental\s+insurance', 'Dental Insurance'),
+    (r'life\s+insurance', 'Life Insurance'),
+    (r'paid\s+parental\s+leave', 'Paid Parental Leave'),
+    (r'paid\s+time\s+off', 'Paid Time Off'),
+))
+_HTML_LOCATION_PATTERNS = tuple(re.compile(pattern, re.I) for pattern in (
+    r'addressLocality["\']?\s*[:=]\s*["\']?([^"\'<,]+)',
+    r'jobLocation["\']?\s*[:=]\s*["\']?([^"\'<]+)',
+))
+_RE_JSON_OBJECT = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}')
+
+# Local parsing patterns
+_TITLE_PATTERNS = tuple(re.compile(pattern, re.MULTILINE) for pattern in (
+    r"Job Title:\s*([^\n]+)",
+    r"^([A-Z][a-zA-Z\s,\-]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director|Specialist))",
+))
+_RE_LINKEDIN_SUFFIX = re.compile(r'\s*\|\s*LinkedIn\s*$')
+_RE_HIRING_PREFIX = re.compile(r'^.*?\s+hiring\s+', re.IGNORECASE)
+_RE_LOCATION_SUFFIX = re.compile(r'\s+in\s+[A-Z][a-zA-Z\s,]+$')
+_COMPANY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"Job Title:\s*([A-Za-z0-9\s&\.]+?)\s+(?:is\s+)?hiring",
+    r"([A-Z][A-Za-z0-9\s&\.]+?)\s+(?:is\s+)?hiring",
+    r"@\s*([A-Z][a-zA-Z0-9\s&]+)",
+    r"at\s+([A-Z][a-zA-Z0-9\s&]+)"
+))
+_INFO_PATTERNS = tuple((re.compile(pattern, re.I), key) for pattern, key in (
+    (r"Team[:\s]+([^\n]{5,100})", "Team"),
+    (r"Reports? to[:\s]+([^\n]{5,100})", "Reports To"),
+    (r"Department[:\s]+([^\n]{5,100})", "Department"),
+    (r"Experience[:\s]+(\d+[^\n]{3,50})", "Experience"),
+    (r"Posted[:\s]+([^\n]{5,50})", "Posted"),
+    (r"Applicants?[:\s]+(\d+[^\n]{3,30})", "Applicants"),
+))
+_SKILL_KEYWORDS = (
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust", "Ruby", "PHP", "Swift", "Kotlin", "Scala",
+    "React", "Angular", "Vue", "Next.js", "HTML", "CSS", "Tailwind", "Redux",
+    "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring", "Rails", ".NET",
+    "SQL", "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "DynamoDB",
+    "AWS", "GCP", "Azure", "Docker", "Kubernetes", "Terraform", "Jenkins", "CI/CD", "Linux",
+    "Machine Learning", "AI", "ML", "Deep Learning", "NLP", "TensorFlow", "PyTorch",
+    "API", "REST", "GraphQL", "Microservices", "gRPC",
+    "Git", "Agile", "Scrum", "JIRA"
+)
+_SKILL_PATTERNS = tuple(
+    (skill, re.compile(rf'\b{re.escape(skill)}\b', re.IGNORECASE)) for skill in _SKILL_KEYWORDS
+)
+_RE_REMOTE_WORK = re.compile(r'\b(?:remote|work\s+from\s+home|wfh)\b', re.I)
+_RE_ONSITE = re.compile(r'\b(?:on-?site|in-?office)\b', re.I)
+_RE_CONTRACT = re.compile(r"\b(?:contract|contractor|temporary)\b", re.I)
+_RE_PART_TIME = re.compile(r"\bpart[-\s]?time\b", re.I)
+_RE_INTERNSHIP = re.compile(r"\b(?:internship|interns?)\b", re.I)
+_RE_SENIOR = re.compile(r'\b(?:senior|sr\.?|lead|principal|staff)\b', re.I)
+_RE_ENTRY = re.compile(r'\b(?:junior|jr\.?|entry|associate)\b', re.I)
+_RE_MID = re.compile(r'\b(?:mid-?level|intermediate)\b', re.I)
+_LOCATION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"Location:\s*([A-Z][a-zA-Z\s,]+(?:United States|[A-Z]{2}))",
+    r"in\s+([A-Z][a-zA-Z\s]+,?\s*(?:United States|USA|[A-Z]{2}))",
+))
+_RE_BENEFITS_LINE = re.compile(r'Benefits:\s*([^\n]+)')
+_BENEFIT_PATTERNS = tuple((re.compile(pattern, re.I), name) for pattern, name in (
+    (r'401\(?k\)?', '401(k)'),
+    (r'vision\s+insurance', 'Vision Insurance'),
+    (r'health\s+insurance', 'Health Insurance'),
+    (r'dental\s+insurance', 'Dental Insurance'),
+    (r'disability\s+insurance', 'Disability Insurance'),
+    (r'life\s+insurance', 'Life Insurance'),
+    (r'paid\s+(?:time\s+off|pto)', 'Paid Time Off'),
+    (r'paid\s+(?:vacation|holidays)', 'Paid Vacation'),
+    (r'paid\s+(?:parental\s+leave|sick)', 'Paid Leave'),
+    (r'(?:stock\s+options|equity|RSUs)', 'Stock Options/Equity'),
+    (r'wellness', 'Wellness Program'),
+    (r'tuition\s+reimbursement', 'Tuition Reimbursement'),
+))
+_RE_HTML_ENTITY = re.compile(r'&[a-z]+;')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_DASH_ITEM = re.compile(r'[-•]\s*([^-•\n]{15,250})')
+_RE_NUMBERED_ITEM = re.compile(r'\d+\.\s*([^\n]{15,250})')
+_LINKEDIN_JOB_ID_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'/jobs/view/(\d+)',             # /jobs/view/123456789
+    r'currentJobId=(\d+)',           # currentJobId=123456789
+    r'/jobs/[^/]+/(\d{8,})',         # /jobs/collections/.../123456789
+))
+
 
 class JobService:
     def __init__(self, ai_service: AIService):
@@ -100,20 +268,34 @@ class JobService:
         if parsed.query:
             safe_url += f"?{parsed.query}"
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; JobHelper/1.0)",
-            "Accept": "text/html",
-        }
         try:
-            async with httpx.AsyncClient(follow_redirects=False, timeout=30.0) as client:
-                response = await client.get(safe_url, headers=headers)
+            client = await _get_http_client()
+            # Stream the body and stop at the size cap instead of buffering
+            # arbitrarily large pages
+            async with client.stream("GET", safe_url) as response:
                 response.raise_for_status()
-                return response.text
+                chunks = []
+                total = 0
+                async for chunk in response.aiter_bytes(_PAGE_CHUNK_BYTES):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= _MAX_PAGE_BYTES:
+                        break
+                body = b"".join(chunks)[:_MAX_PAGE_BYTES]
+                return body.decode(response.encoding or "utf-8", errors="replace")
         except httpx.HTTPError:
             return None
         except Exception:
             return None
     
+    @staticmethod
+    def _fetch_with_trafilatura(url: str) -> Optional[str]:
+        """Download and extract a page with trafilatura (blocking)."""
+        downloaded = trafilatura.fetch_url(url)
+        if not downloaded:
+            return None
+        return trafilatura.extract(downloaded)
+    
     def _extract_text_from_html(self, html_content: str) -> str:
         """Extract readable text from HTML using trafilatura or meta tags"""
         # First try to extract from meta tags (many modern job boards use this)
@@ -128,32 +310,16 @@ class JobService:
         except Exception:
             pass
         
-        # Fallback: Use html.parser (safer than regex)
+        # Fallback: walk the DOM with lxml's C parser (safer than regex)
         try:
-            from html.parser import HTMLParser
-            
-            class TextExtractor(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.text_parts = []
-                    self.skip_tags = {'script', 'style', 'noscript'}
-                    self.current_tag = None
-                
-                def handle_starttag(self, tag, attrs):
-                    self.current_tag = tag.lower()
-                
-                def handle_endtag(self, tag):
-                    self.current_tag = None
-                
-                def handle_data(self, data):
-                    if self.current_tag not in self.skip_tags:
-                        text = data.strip()
-                        if text:
-                            self.text_parts.append(text)
+            from lxml import html as lxml_html
             
-            parser = TextExtractor()
-            parser.feed(html_content)
-            return ' '.join(parser.text_parts)[:10000]
+            parser = lxml_html.HTMLParser(encoding='utf-8')
+            tree = lxml_html.fromstring(html_content.encode('utf-8'), parser=parser)
+            for node in tree.xpath('//script | //style | //noscript'):
+                node.drop_tree()
+            text_parts = (text.strip() for text in tree.itertext())
+            return ' '.join(filter(None, text_parts))[:10000]
         except Exception:
             return meta_content or ""
     
@@ -178,19 +344,19 @@ class JobService:
             if title:
                 parts.append(f"Job Title: {title}")
                 # Extract location from LinkedIn title format "Company hiring Role in Location | LinkedIn"
-                loc_match = re.search(r'in\s+([A-Z][a-zA-Z\s]+,?\s*(?:United States|[A-Z]{2})?)', title)
+                loc_match = _RE_TITLE_LOCATION.search(title)
                 if loc_match:
                     extracted["location"] = loc_match.group(1).strip()
             
             # LinkedIn specific: Get full content from show-more-less-html divs
-            show_more_divs = soup.find_all(class_=re.compile(r'show-more-less-html'))
+            show_more_divs = soup.find_all(class_=_RE_SHOW_MORE_CLASS)
             for div in show_more_divs:
                 text = div.get_text(separator=' ', strip=True)
                 if len(text) > 100:
                     parts.append(html_lib.unescape(text))
             
             # LinkedIn specific: Get description from description classes
-            desc_divs = soup.find_all(class_=re.compile(r'description'))
+            desc_divs = soup.find_all(class_=_RE_DESCRIPTION_CLASS)
             for div in desc_divs:
                 text = div.get_text(separator=' ', strip=True)
                 if len(text) > 200 and text not in ''.join(parts):
@@ -207,42 +373,28 @@ class JobService:
                         parts.append(html_lib.unescape(og_desc['content']))
             
             # Extract salary from HTML (LinkedIn often has this)
-            salary_match = re.search(r'\$[\d,]+\s*[-–]\s*\$[\d,]+(?:\s*(?:per\s+)?(?:year|yr|annually))?', html_content, re.I)
+            salary_match = _RE_SALARY_RANGE.search(html_content)
             if salary_match:
                 extracted["salary"] = salary_match.group()
                 parts.append(f"Salary Range: {extracted['salary']}")
             
             # Also check for salary in structured format
-            salary_patterns = [
-                r'baseSalary["\']?\s*[:=]\s*["\']?\$?([\d,]+)',
-                r'salary["\']?\s*[:=]\s*["\']?\$?([\d,]+)',
-            ]
-            for pattern in salary_patterns:
-                match = re.search(pattern, html_content, re.I)
+            for pattern in _HTML_SALARY_PATTERNS:
+                match = pattern.search(html_content)
                 if match and not extracted["salary"]:
                     extracted["salary"] = f"${match.group(1)}"
                     parts.append(f"Salary: {extracted['salary']}")
             
             # Extract work type (Hybrid/Remote/On-site)
-            if re.search(r'\bHybrid\b', html_content, re.I):
+            if _RE_HYBRID.search(html_content):
                 parts.append("Work Type: Hybrid")
-            elif re.search(r'\bRemote\b', html_content, re.I):
+            elif _RE_REMOTE.search(html_content):
                 parts.append("Work Type: Remote")
             
             # Extract benefits directly from HTML
             benefits_found = []
-            benefit_searches = [
-                (r'401\(?k\)?', '401(k)'),
-                (r'vision\s+insurance', 'Vision Insurance'),
-                (r'disability\s+insurance', 'Disability Insurance'),
-                (r'health\s+insurance', 'Health Insurance'),
-                (r'dental\s+insurance', 'Dental Insurance'),
-                (r'life\s+insurance', 'Life Insurance'),
-                (r'paid\s+parental\s+leave', 'Paid Parental Leave'),
-                (r'paid\s+time\s+off', 'Paid Time Off'),
-            ]
-            for pattern, name in benefit_searches:
-                if re.search(pattern, html_content, re.I):
+            for pattern, name in _HTML_BENEFIT_PATTERNS:
+                if pattern.search(html_content):
                     benefits_found.append(name)
             
             if benefits_found:
@@ -250,12 +402,8 @@ class JobService:
             
             # Extract location patterns
             if not extracted["location"]:
-                loc_patterns = [
-                    r'addressLocality["\']?\s*[:=]\s*["\']?([^"\'<,]+)',
-                    r'jobLocation["\']?\s*[:=]\s*["\']?([^"\'<]+)',
-                ]
-                for pattern in loc_patterns:
-                    match = re.search(pattern, html_content, re.I)
+                for pattern in _HTML_LOCATION_PATTERNS:
+                    match = pattern.search(html_content)
                     if match:
                         extracted["location"] = match.group(1).strip()
                         break
@@ -312,15 +460,14 @@ class JobService:
         if html_content:
             content = self._extract_text_from_html(html_content)
         
-        # Method 2: Fallback to trafilatura if httpx didn't get enough content
+        # Method 2: Fallback to trafilatura if httpx didn't get enough content.
+        # Its fetch is blocking urllib I/O, so run it off the event loop.
         # SECURITY: safe_url has been validated against our allowlist
         if not content or len(content.strip()) < 100:
             try:
-                downloaded = trafilatura.fetch_url(safe_url)
-                if downloaded:
-                    t_content = trafilatura.extract(downloaded)
-                    if t_content and len(t_content) > len(content or ""):
-                        content = t_content
+                t_content = await asyncio.to_thread(self._fetch_with_trafilatura, safe_url)
+                if t_content and len(t_content) > len(content or ""):
+                    content = t_content
             except Exception:
                 pass
         
@@ -377,11 +524,11 @@ Return ONLY valid JSON with these fields:
             
             # Extract JSON from response
             response_text = response_text.strip()
-            json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response_text)
+            json_match = _RE_JSON_OBJECT.search(response_text)
             if json_match:
                 response_text = json_match.group()
             
-            data = json.loads(response_text)
+            data = json_loads(response_text)
             
             # Verify we got actual job data
             if not data.get("title") or data.get("title") == "Unknown Title":
@@ -415,31 +562,21 @@ Return ONLY valid JSON with these fields:
         
         # Extract title
         title = self._extract_title_from_url(url) or "Job Position"
-        title_patterns = [
-            r"Job Title:\s*([^\n]+)",
-            r"^([A-Z][a-zA-Z\s,\-]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director|Specialist))",
-        ]
-        for pattern in title_patterns:
-            match = re.search(pattern, content, re.MULTILINE)
+        for pattern in _TITLE_PATTERNS:
+            match = pattern.search(content)
             if match:
                 title = match.group(1).strip()[:200]
                 break
         
         # Clean up LinkedIn-style titles
-        title = re.sub(r'\s*\|\s*LinkedIn\s*$', '', title)
-        title = re.sub(r'^.*?\s+hiring\s+', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s+in\s+[A-Z][a-zA-Z\s,]+$', '', title)
+        title = _RE_LINKEDIN_SUFFIX.sub('', title)
+        title = _RE_HIRING_PREFIX.sub('', title)
+        title = _RE_LOCATION_SUFFIX.sub('', title)
         
         # Extract company
         company = self._extract_company_from_url(url)
-        company_patterns = [
-            r"Job Title:\s*([A-Za-z0-9\s&\.]+?)\s+(?:is\s+)?hiring",
-            r"([A-Z][A-Za-z0-9\s&\.]+?)\s+(?:is\s+)?hiring",
-            r"@\s*([A-Z][a-zA-Z0-9\s&]+)", 
-            r"at\s+([A-Z][a-zA-Z0-9\s&]+)"
-        ]
-        for pattern in company_patterns:
-            match = re.search(pattern, content[:2000])
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(content[:2000])
             if match:
                 extracted_company = match.group(1).strip()
                 if 3 < len(extracted_company) < 100 and extracted_company.lower() not in ["job", "the", "we"]:
@@ -494,98 +631,59 @@ Return ONLY valid JSON with these fields:
         
         # 7. Extract Job Info (structured metadata)
         job_info = {}
-        info_patterns = [
-            (r"Team[:\s]+([^\n]{5,100})", "Team"),
-            (r"Reports? to[:\s]+([^\n]{5,100})", "Reports To"),
-            (r"Department[:\s]+([^\n]{5,100})", "Department"),
-            (r"Experience[:\s]+(\d+[^\n]{3,50})", "Experience"),
-            (r"Posted[:\s]+([^\n]{5,50})", "Posted"),
-            (r"Applicants?[:\s]+(\d+[^\n]{3,30})", "Applicants"),
-        ]
-        for pattern, key in info_patterns:
-            match = re.search(pattern, content, re.I)
+        for pattern, key in _INFO_PATTERNS:
+            match = pattern.search(content)
             if match:
                 job_info[key] = match.group(1).strip()[:100]
         
         # 8. Extract Skills
-        skill_keywords = [
-            "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust", "Ruby", "PHP", "Swift", "Kotlin", "Scala",
-            "React", "Angular", "Vue", "Next.js", "HTML", "CSS", "Tailwind", "Redux",
-            "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring", "Rails", ".NET",
-            "SQL", "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "DynamoDB",
-            "AWS", "GCP", "Azure", "Docker", "Kubernetes", "Terraform", "Jenkins", "CI/CD", "Linux",
-            "Machine Learning", "AI", "ML", "Deep Learning", "NLP", "TensorFlow", "PyTorch",
-            "API", "REST", "GraphQL", "Microservices", "gRPC",
-            "Git", "Agile", "Scrum", "JIRA"
-        ]
-        found_skills = []
-        for skill in skill_keywords:
-            if re.search(rf'\b{re.escape(skill)}\b', content, re.IGNORECASE):
-                found_skills.append(skill)
+        found_skills = [skill for skill, pattern in _SKILL_PATTERNS if pattern.search(content)]
         
         # 9. Extract Work Arrangement
         work_arrangement = None
-        if re.search(r'\bHybrid\b', content, re.I):
+        if _RE_HYBRID.search(content):
             work_arrangement = "Hybrid"
-        elif re.search(r'\b(?:remote|work\s+from\s+home|wfh)\b', content, re.I):
+        elif _RE_REMOTE_WORK.search(content):
             work_arrangement = "Remote"
-        elif re.search(r'\b(?:on-?site|in-?office)\b', content, re.I):
+        elif _RE_ONSITE.search(content):
             work_arrangement = "On-site"
         
         # 10. Extract Job Type
         job_type = "Full-time"
-        if re.search(r"\b(?:contract|contractor|temporary)\b", content, re.I): job_type = "Contract"
-        elif re.search(r"\bpart[-\s]?time\b", content, re.I): job_type = "Part-time"
-        elif re.search(r"\b(?:internship|interns?)\b", content, re.I): job_type = "Internship"
+        if _RE_CONTRACT.search(content): job_type = "Contract"
+        elif _RE_PART_TIME.search(content): job_type = "Part-time"
+        elif _RE_INTERNSHIP.search(content): job_type = "Internship"
         
         # 11. Extract Experience Level
         experience_level = None
-        if re.search(r'\b(?:senior|sr\.?|lead|principal|staff)\b', content, re.I):
+        if _RE_SENIOR.search(content):
             experience_level = "Senior"
-        elif re.search(r'\b(?:junior|jr\.?|entry|associate)\b', content, re.I):
+        elif _RE_ENTRY.search(content):
             experience_level = "Entry Level"
-        elif re.search(r'\b(?:mid-?level|intermediate)\b', content, re.I):
+        elif _RE_MID.search(content):
             experience_level = "Mid Level"
         
         # 12. Extract Location and Salary
         location = None
-        loc_patterns = [
-            r"Location:\s*([A-Z][a-zA-Z\s,]+(?:United States|[A-Z]{2}))",
-            r"in\s+([A-Z][a-zA-Z\s]+,?\s*(?:United States|USA|[A-Z]{2}))",
-        ]
-        for pattern in loc_patterns:
-            match = re.search(pattern, content[:3000])
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(content[:3000])
             if match:
                 location = match.group(1).strip()[:100]
                 break
         
         salary_range = None
-        salary_match = re.search(r'\$[\d,]+\s*[-–]\s*\$[\d,]+(?:\s*(?:per\s+)?(?:year|yr|annually))?', content, re.I)
+        salary_match = _RE_SALARY_RANGE.search(content)
         if salary_match:
             salary_range = salary_match.group()
         
         # 13. Extract Benefits
         benefits = []
-        benefits_line_match = re.search(r'Benefits:\s*([^\n]+)', content)
+        benefits_line_match = _RE_BENEFITS_LINE.search(content)
         if benefits_line_match:
             benefits = [b.strip() for b in benefits_line_match.group(1).split(',') if b.strip()]
         
-        benefit_patterns = [
-            (r'401\(?k\)?', '401(k)'),
-            (r'vision\s+insurance', 'Vision Insurance'),
-            (r'health\s+insurance', 'Health Insurance'),
-            (r'dental\s+insurance', 'Dental Insurance'),
-            (r'disability\s+insurance', 'Disability Insurance'),
-            (r'life\s+insurance', 'Life Insurance'),
-            (r'paid\s+(?:time\s+off|pto)', 'Paid Time Off'),
-            (r'paid\s+(?:vacation|holidays)', 'Paid Vacation'),
-            (r'paid\s+(?:parental\s+leave|sick)', 'Paid Leave'),
-            (r'(?:stock\s+options|equity|RSUs)', 'Stock Options/Equity'),
-            (r'wellness', 'Wellness Program'),
-            (r'tuition\s+reimbursement', 'Tuition Reimbursement'),
-        ]
-        for pattern, name in benefit_patterns:
-            if re.search(pattern, content, re.I):
+        for pattern, name in _BENEFIT_PATTERNS:
+            if pattern.search(content):
                 if name not in benefits:
                     benefits.append(name)
         
@@ -631,8 +729,8 @@ Return ONLY valid JSON with these fields:
             if match:
                 text = match.group(1).strip()
                 # Clean HTML entities
-                text = re.sub(r'&[a-z]+;', ' ', text)
-                text = re.sub(r'\s+', ' ', text)
+                text = _RE_HTML_ENTITY.sub(' ', text)
+                text = _RE_WHITESPACE.sub(' ', text)
                 return text[:2000] if len(text) > 50 else None
         return None
     
@@ -643,9 +741,9 @@ Return ONLY valid JSON with these fields:
             if match:
                 section_text = match.group(1)
                 # Extract bullet points or numbered items
-                items = re.findall(r'[-•]\s*([^-•\n]{15,250})', section_text)
+                items = _RE_DASH_ITEM.findall(section_text)
                 if not items:
-                    items = re.findall(r'\d+\.\s*([^\n]{15,250})', section_text)
+                    items = _RE_NUMBERED_ITEM.findall(section_text)
                 return [item.strip() for item in items if len(item.strip()) > 10][:15]
         return []
     
@@ -712,20 +810,10 @@ Return ONLY valid JSON with these fields:
     def _normalize_linkedin_url(self, url: str) -> str:
         """Convert LinkedIn URLs to the most accessible format."""
         # Extract job ID from various LinkedIn URL formats
-        # Format 1: /jobs/view/123456789
-        view_match = re.search(r'/jobs/view/(\d+)', url)
-        if view_match:
-            return f"https://www.linkedin.com/jobs/view/{view_match.group(1)}"
-        
-        # Format 2: currentJobId=123456789
-        current_job_match = re.search(r'currentJobId=(\d+)', url)
-        if current_job_match:
-            return f"https://www.linkedin.com/jobs/view/{current_job_match.group(1)}"
-        
-        # Format 3: /jobs/collections/.../123456789
-        collection_match = re.search(r'/jobs/[^/]+/(\d{8,})', url)
-        if collection_match:
-            return f"https://www.linkedin.com/jobs/view/{collection_match.group(1)}"
+        for pattern in _LINKEDIN_JOB_ID_PATTERNS:
+            match = pattern.search(url)
+            if match:
+                return f"https://www.linkedin.com/jobs/view/{match.group(1)}"
         
         return url
     
@@ -60,8 +60,8 @@ class ResumeVerifier:
         # 2. Validate Bullets (if provided)
         bullet_scores = []
         if bullets:
-            for i, bullet in enumerate(bullets):
-                validation = BulletValidator.validate_bullet(bullet)
+            validations = BulletValidator.validate_bullets(bullets)
+            for i, validation in enumerate(validations):
                 
                 results["bullet_validation"].append({
                     "bullet_index": i,
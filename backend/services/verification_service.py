@@ -171,7 +171,7 @@ class ResumeVerifier:
         bullets = cls._collect_all_bullets(data)
         if not bullets:
             return VerificationResult("metric_diversity", VerificationStatus.WARNING, "No bullets to analyze")
-        analysis = MetricDiversifier.check_diversity(bullets)
+        analysis = MetricDiversifier.check_diversity(bullets, verbose=False)
         if analysis.get("warnings"):
             return VerificationResult(
                 "metric_diversity",
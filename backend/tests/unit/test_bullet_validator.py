@@ -0,0 +1,30 @@
+"""
+Unit Tests for Bullet Validator Service
+Tests weak action verb detection.
+"""
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from services.bullet_validator import BulletValidator
+
+
+class TestActionVerbCheck:
+    """Test suite for the action verb check."""
+
+    def test_whole_word_weak_verb_is_flagged(self):
+        """Test a weak verb used as a whole word is reported."""
+        warnings, suggestions = [], []
+
+        assert BulletValidator._check_action_verb("Handled", warnings, suggestions) is False
+        assert warnings and "Weak action verb" in warnings[0]
+        assert suggestions
+
+    def test_weak_verb_inside_another_word_is_not_flagged(self):
+        """Test a weak verb embedded in a longer word is not reported."""
+        for action in ("Mishandled", "Foreshadowed"):
+            warnings, suggestions = [], []
+
+            assert BulletValidator._check_action_verb(action, warnings, suggestions) is True
+            assert not any("Weak action verb" in w for w in warnings)
@@ -0,0 +1,60 @@
+"""
+Unit Tests for Competency Assessor Service
+Tests keyword matching used for JD competency weightage and fit scoring.
+"""
+
+import pytest
+from services.competency_assessor import CompetencyAssessor
+
+
+class TestCompetencyAssessor:
+    """Test suite for Competency Assessor service."""
+
+    def test_keyword_stems_match_inflected_jd_words(self):
+        """Test single-word keywords match their inflections in the JD."""
+        jd = "You will be leading people management for the team, mentoring PMs and shipping launches."
+        assessment = CompetencyAssessor.assess_job_description(jd)
+
+        leadership = next(
+            c for c in assessment["competencies"] if c["name"] == "Leadership & Team"
+        )
+        assert {"lead", "manage", "mentor", "team"} <= set(leadership["keywords_found"])
+
+        execution = next(
+            c for c in assessment["competencies"] if c["name"] == "Execution & Delivery"
+        )
+        assert {"ship", "launch"} <= set(execution["keywords_found"])
+
+    def test_keywords_do_not_match_inside_other_words(self):
+        """Test short keywords only match at the start of a word."""
+        counts = CompetencyAssessor._profile("building the guide for our clients").counts
+
+        assert "ui" not in counts
+        assert "lead" not in counts
+
+    def test_symbol_keywords_stay_one_token(self):
+        """Test keywords containing symbols are matched as whole tokens."""
+        counts = CompetencyAssessor._profile("owned the p&l and wrote c++ services").counts
+
+        assert counts.get("p&l") == 1
+
+    def test_fit_score_matches_inflected_resume_verbs(self):
+        """Test resume bullets in past tense still match the JD's stem keywords."""
+        jd = "Looking for a PM to lead, manage, mentor, ship, hire and coach."
+        assessment = CompetencyAssessor.assess_job_description(jd)
+        experience = [{
+            "role": "Product Manager",
+            "description": (
+                "Managed a team of 8 engineers and mentored 3 PMs. "
+                "Shipped 5 releases. Hired and coached 4 designers."
+            )
+        }]
+
+        fit = CompetencyAssessor.calculate_fit_score(assessment, [], experience)
+
+        leadership = next(
+            c for c in fit["competency_scores"] if c["competency"] == "Leadership & Team"
+        )
+        # "managed", "mentored", "hired", "coached" and "team"
+        assert leadership["matched_keywords"] == 5
+        assert fit["overall_fit"] >= 45
@@ -0,0 +1,30 @@
+"""
+Unit Tests for Export Service
+Tests LaTeX escaping of resume fields.
+"""
+
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("docx")
+pytest.importorskip("fpdf")
+pytest.importorskip("slugify")
+
+from services.export_service import _escape_latex
+
+
+class TestEscapeLatex:
+    """Test suite for LaTeX escaping."""
+
+    def test_escapes_special_characters(self):
+        """Test ampersands and backslashes are escaped in a single pass."""
+        assert _escape_latex("a&b\\") == r"a\&b\textbackslash{}"
+
+    def test_escapes_caret_and_tilde(self):
+        """Test ^ and ~ use text-mode commands instead of accents."""
+        assert _escape_latex("x^2 ~ y") == r"x\textasciicircum{}2 \textasciitilde{} y"
+
+    def test_plain_and_empty_text(self):
+        """Test text without special characters is returned unchanged."""
+        assert _escape_latex("Product Manager") == "Product Manager"
+        assert _escape_latex("") == ""
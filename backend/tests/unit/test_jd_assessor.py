@@ -121,6 +121,36 @@ class TestJDAssessor:
         assert "interest_level" in result
         assert "decision" in result
 
+    def test_assess_is_memoized(self, monkeypatch):
+        """Test repeated assessments of the same inputs reuse the cached result."""
+        JDAssessor.cache_clear()
+        calls = []
+        original = JDAssessor._assess
+        monkeypatch.setattr(
+            JDAssessor, "_assess", staticmethod(lambda *args: calls.append(args) or original(*args))
+        )
+        
+        first = JDAssessor.assess(self.sample_jd, self.sample_resume)
+        assert JDAssessor.assess(self.sample_jd, dict(self.sample_resume)) == first
+        assert len(calls) == 1
+        
+        other_resume = {**self.sample_resume, "skills": ["Tableau"]}
+        JDAssessor.assess(self.sample_jd, other_resume)
+        assert len(calls) == 2
+
+    def test_cached_assessment_is_not_shared(self):
+        """Test changes to a returned assessment do not leak into later calls."""
+        JDAssessor.cache_clear()
+        first = JDAssessor.assess(self.sample_jd, self.sample_resume)
+        first.strengths.append("edited")
+        first.skills_intelligence["prioritized_tier_1"].append("edited")
+        first.competency_matches[0].matched_keywords.append("edited")
+        
+        second = JDAssessor.assess(self.sample_jd, self.sample_resume)
+        assert "edited" not in second.strengths
+        assert "edited" not in second.skills_intelligence["prioritized_tier_1"]
+        assert "edited" not in second.competency_matches[0].matched_keywords
+
     def test_empty_resume(self):
         """Test handling of empty resume data."""
         empty_resume = {"name": "Test", "email": "test@test.com"}